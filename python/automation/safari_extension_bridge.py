@@ -19,6 +19,11 @@ class SafariExtensionBridge:
     """Bridge to communicate with Safari Web Extension via JavaScript injection."""
     
     def __init__(self):
+        # Cached result of check_extension_loaded(); reset by any call that
+        # fails or returns an empty / non-JSON result - what a call into a
+        # missing window.tiktokAutomation looks like after a reload or
+        # navigation, since do JavaScript returns missing value when page
+        # JS throws
         self.extension_loaded = False
     
     def _run_applescript(self, script: str, timeout: int = 30) -> str:
@@ -68,10 +73,12 @@ class SafariExtensionBridge:
                 return json.loads(result)
             except json.JSONDecodeError:
                 # If not JSON, return as string
+                self.extension_loaded = False
                 return {"success": False, "error": result, "raw": result}
                 
         except Exception as e:
             logger.error(f"JavaScript injection error: {e}")
+            self.extension_loaded = False
             return {"success": False, "error": str(e)}
     
     def check_extension_loaded(self) -> bool:
@@ -87,15 +94,41 @@ class SafariExtensionBridge:
         
         result = self._inject_js(js)
         loaded = result.get('loaded', False) if result else False
+        self.extension_loaded = loaded
         
         if loaded:
-            self.extension_loaded = True
             logger.debug("✅ Safari extension is loaded")
         else:
             logger.warning("⚠️ Safari extension not detected - make sure it's installed and enabled")
         
         return loaded
     
+    def _ensure_extension_loaded(self) -> bool:
+        """
+        Return True if the extension is loaded, probing Safari only when
+        no earlier probe has succeeded.
+        
+        Saves one osascript round trip per call on bulk typing paths.
+        """
+        return self.extension_loaded or self.check_extension_loaded()
+    
+    def _call_extension(self, js_code: str) -> Optional[Dict]:
+        """
+        Inject a window.tiktokAutomation call and return its result, or
+        None if the extension is not loaded.
+        
+        When the call invalidates the cached probe, the extension is
+        probed again before its result is trusted, so a page that lost
+        the extension reports "Extension not loaded" and the next call
+        re-probes. The call itself is never retried.
+        """
+        if not self._ensure_extension_loaded():
+            return None
+        result = self._inject_js(js_code)
+        if not self.extension_loaded and not self.check_extension_loaded():
+            return None
+        return result
+    
     def type_comment(self, text: str) -> Dict:
         """
         Type a comment into TikTok's comment field using the extension.
@@ -106,12 +139,6 @@ class SafariExtensionBridge:
         Returns:
             Dict with success status, button state, etc.
         """
-        if not self.check_extension_loaded():
-            return {
-                "success": False,
-                "error": "Extension not loaded",
-                "text": text
-            }
         
         # Call the extension's typeComment function
         js = f'''
@@ -166,7 +193,13 @@ class SafariExtensionBridge:
         }})()
         '''
         
-        result = self._inject_js(js_wrapper)
+        result = self._call_extension(js_wrapper)
+        if result is None:
+            return {
+                "success": False,
+                "error": "Extension not loaded",
+                "text": text
+            }
         
         if result and result.get('success'):
             logger.info(f"✅ Typed comment: {text[:30]}... (length: {len(text)})")
@@ -182,9 +215,6 @@ class SafariExtensionBridge:
     
     def click_post(self) -> Dict:
         """Click the Post button."""
-        if not self.check_extension_loaded():
-            return {"success": False, "error": "Extension not loaded"}
-        
         js = '''
         (function() {
             var result = window.tiktokAutomation.clickPost();
@@ -192,7 +222,9 @@ class SafariExtensionBridge:
         })()
         '''
         
-        result = self._inject_js(js)
+        result = self._call_extension(js)
+        if result is None:
+            return {"success": False, "error": "Extension not loaded"}
         
         if result and result.get('success'):
             logger.info("✅ Clicked Post button")
@@ -204,9 +236,6 @@ class SafariExtensionBridge:
     
     def open_comments(self) -> Dict:
         """Open the comments panel."""
-        if not self.check_extension_loaded():
-            return {"success": False, "error": "Extension not loaded"}
-        
         js = '''
         (function() {
             var result = window.tiktokAutomation.openComments();
@@ -214,14 +243,13 @@ class SafariExtensionBridge:
         })()
         '''
         
-        result = self._inject_js(js)
+        result = self._call_extension(js)
+        if result is None:
+            return {"success": False, "error": "Extension not loaded"}
         return result or {"success": False, "error": "No result"}
     
     def focus_input(self) -> Dict:
         """Focus the comment input field."""
-        if not self.check_extension_loaded():
-            return {"success": False, "error": "Extension not loaded"}
-        
         js = '''
         (function() {
             var result = window.tiktokAutomation.focusInput();
@@ -229,14 +257,13 @@ class SafariExtensionBridge:
         })()
         '''
         
-        result = self._inject_js(js)
+        result = self._call_extension(js)
+        if result is None:
+            return {"success": False, "error": "Extension not loaded"}
         return result or {"success": False, "error": "No result"}
     
     def check_status(self) -> Dict:
         """Check the current status of the comment input and button."""
-        if not self.check_extension_loaded():
-            return {"success": False, "error": "Extension not loaded"}
-        
         js = '''
         (function() {
             var result = window.tiktokAutomation.checkStatus();
@@ -244,7 +271,9 @@ class SafariExtensionBridge:
         })()
         '''
         
-        result = self._inject_js(js)
+        result = self._call_extension(js)
+        if result is None:
+            return {"success": False, "error": "Extension not loaded"}
         return result or {"success": False, "error": "No result"}
     
     def post_comment(self, text: str, verify: bool = True) -> Dict:
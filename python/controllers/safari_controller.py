@@ -12,12 +12,99 @@ Usage:
     result = safari.execute_js('return document.title')
 """
 
+import json
+import select
 import subprocess
-import tempfile
 import time
-import os
-from typing import Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
+
+
+# pyobjc is optional - lets type_via_clipboard paste without spawning
+# pbcopy and osascript. Imported on first paste, not with this module.
+@lru_cache(maxsize=1)
+def _pyobjc():
+    """Return (Quartz, AppKit), or None when pyobjc isn't installed."""
+    try:
+        import AppKit
+        import Quartz
+    except ImportError:
+        return None
+    return Quartz, AppKit
+
+
+_KEYCODE_V = 0x09
+
+
+# Separates per-script results in execute_js_batch output. Printable on
+# purpose: control separators count as whitespace and would be eaten by the
+# strip() in run_applescript when trailing results are empty.
+_BATCH_DELIMITER = "__JS_BATCH_SEP__"
+
+# Resident JXA worker used by execute_js. It reads one JSON-encoded JS
+# string per line on stdin, runs it in the front document and answers
+# with one {ok, out} JSON line, so repeated calls (e.g. wait_for_js
+# probes) skip the osascript fork/exec. Exits on stdin EOF.
+_JS_WORKER = '''
+ObjC.import('Foundation');
+function run() {
+    var safari = Application('Safari');
+    var input = $.NSFileHandle.fileHandleWithStandardInput;
+    var output = $.NSFileHandle.fileHandleWithStandardOutput;
+    var buffer = '';
+    while (true) {
+        var nl = buffer.indexOf('\\n');
+        if (nl < 0) {
+            var data = input.availableData;
+            if (data.length == 0) return;
+            buffer += $.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding).js;
+            continue;
+        }
+        var line = buffer.slice(0, nl);
+        buffer = buffer.slice(nl + 1);
+        var reply;
+        try {
+            var r = safari.doJavaScript(JSON.parse(line), {in: safari.documents[0]});
+            reply = {ok: true, out: (r === undefined || r === null) ? '' : String(r)};
+        } catch (e) {
+            reply = {ok: false, out: String(e)};
+        }
+        output.writeData($(JSON.stringify(reply) + '\\n').dataUsingEncoding($.NSUTF8StringEncoding));
+    }
+}
+'''
+
+# Runs argv[1] as JS in the front document. The envelope is constant, so
+# it is built once and the JS never needs escaping or a temp file.
+_AS_JS = '''
+on run argv
+    tell application "Safari"
+        tell front document
+            return do JavaScript (item 1 of argv)
+        end tell
+    end tell
+end run
+'''
+
+# Runs every argv item as JS in the front document and returns the results
+# joined by _BATCH_DELIMITER, so N scripts cost one osascript process.
+_AS_JS_BATCH = '''
+on run argv
+    set out to {}
+    tell application "Safari"
+        tell front document
+            repeat with js in argv
+                set r to do JavaScript (js as text)
+                if r is missing value then set r to ""
+                set end of out to (r as text)
+            end repeat
+        end tell
+    end tell
+    set AppleScript's text item delimiters to "__JS_BATCH_SEP__"
+    return out as text
+end run
+'''
 
 
 @dataclass
@@ -39,21 +126,24 @@ class SafariController:
     def __init__(self):
         self._last_url = ""
         self._session_active = False
+        self._js_worker: Optional[subprocess.Popen] = None
+        self._js_worker_broken = False
     
-    def run_applescript(self, script: str, timeout: int = 30) -> Tuple[bool, str]:
+    def run_applescript(self, script: str, timeout: int = 30, args: Sequence[str] = ()) -> Tuple[bool, str]:
         """
         Execute AppleScript and return (success, output).
         
         Args:
             script: AppleScript code to execute
             timeout: Maximum execution time in seconds
+            args: Strings passed to the script's run handler as argv
             
         Returns:
             Tuple of (success: bool, output: str)
         """
         try:
             result = subprocess.run(
-                ['osascript', '-e', script],
+                ['osascript', '-e', script, *args],
                 capture_output=True,
                 text=True,
                 timeout=timeout
@@ -98,18 +188,19 @@ class SafariController:
         """
         self.ensure_safari_ready()
         
+        # Wait and read back the final URL in the same osascript process
         script = f'''
         tell application "Safari"
             activate
             set URL of front document to "{url}"
         end tell
+        delay {wait_time}
+        tell application "Safari" to return URL of front document
         '''
-        success, _ = self.run_applescript(script)
+        success, current = self.run_applescript(script, timeout=30 + int(wait_time))
         
         if success:
-            self._last_url = url
-            time.sleep(wait_time)
-            current = self.get_current_url()
+            self._last_url = current
             return NavigationResult(success=True, url=current)
         
         return NavigationResult(success=False, url="", error="Navigation failed")
@@ -173,22 +264,126 @@ class SafariController:
         Returns:
             Result string or None if execution failed
         """
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.js', delete=False) as f:
-            f.write(code)
-            js_file = f.name
+        reply = self._run_js_in_worker(code, timeout=15)
+        if reply is None:
+            reply = self.run_applescript(_AS_JS, timeout=15, args=(code,))
+        success, output = reply
+        return output if success else None
+    
+    def _run_js_in_worker(self, code: str, timeout: float) -> Optional[Tuple[bool, str]]:
+        """
+        Run JavaScript through the resident osascript worker.
         
-        script = f'''
-        tell application "Safari"
-            tell front document
-                set jsCode to read POSIX file "{js_file}"
-                do JavaScript jsCode
-            end tell
-        end tell
-        '''
+        Returns:
+            (success, output) like run_applescript, or None when the worker
+            is unavailable and the caller should use a one-shot osascript.
+            Once the script has been handed to the worker failures are
+            returned, never None - falling back would run it twice.
+        """
+        if self._js_worker_broken:
+            return None
+        if self._js_worker is None or self._js_worker.poll() is not None:
+            try:
+                self._js_worker = subprocess.Popen(
+                    ['osascript', '-l', 'JavaScript', '-e', _JS_WORKER],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL
+                )
+            except OSError:
+                self._js_worker_broken = True
+                return None
         
-        success, output = self.run_applescript(script, timeout=15)
-        os.unlink(js_file)
-        return output if success else None
+        worker = self._js_worker
+        try:
+            worker.stdin.write(json.dumps(code).encode('ascii') + b'\n')
+            worker.stdin.flush()
+        except (OSError, ValueError):
+            # Worker died before taking the script; stay on one-shot osascript
+            self.close()
+            self._js_worker_broken = True
+            return None
+        
+        try:
+            ready, _, _ = select.select([worker.stdout], [], [], timeout)
+            if not ready:
+                # Stuck on this script - restart the worker on the next call
+                self.close()
+                return False, "timeout"
+            line = worker.stdout.readline()
+        except (OSError, ValueError):
+            line = b''
+        
+        if not line:
+            # Worker died after reading the script, which may have run
+            self.close()
+            self._js_worker_broken = True
+            return False, "worker exited"
+        try:
+            reply = json.loads(line)
+            return reply['ok'], reply['out'].strip()
+        except (ValueError, KeyError, TypeError):
+            # Out of step with the protocol - restart the worker on the next call
+            self.close()
+            return False, "bad worker reply"
+    
+    def close(self):
+        """Stop the resident JavaScript worker, if running."""
+        worker, self._js_worker = self._js_worker, None
+        if worker is not None and worker.poll() is None:
+            worker.kill()
+            worker.wait()
+    
+    def __enter__(self) -> "SafariController":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def wait_for_js(self, probe_js: str, timeout: float = 8.0, interval: float = 0.1) -> Optional[str]:
+        """
+        Poll a JavaScript probe until it reports ready.
+        
+        Args:
+            probe_js: JavaScript expression; "", "false", "null" and
+                "undefined" mean not ready yet
+            timeout: Maximum wait time in seconds
+            interval: Seconds between probes
+            
+        Returns:
+            The probe's first ready result, or None on timeout
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            output = self.execute_js(probe_js)
+            if output and output not in ("false", "null", "undefined"):
+                return output
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(interval)
+    
+    def execute_js_batch(self, scripts: Sequence[str]) -> Optional[List[str]]:
+        """
+        Execute several JavaScript snippets in one osascript process.
+        
+        The snippets run in order in the front document with no delay
+        between them, so only batch steps that don't wait on each other.
+        
+        Args:
+            scripts: JavaScript snippets to execute
+            
+        Returns:
+            One result string per snippet, or None if execution failed
+        """
+        if not scripts:
+            return []
+        success, output = self.run_applescript(_AS_JS_BATCH, timeout=15, args=scripts)
+        if not success:
+            return None
+        results = output.split(_BATCH_DELIMITER)
+        if len(results) != len(scripts):
+            return None
+        return results
     
     def take_screenshot(self, filepath: str) -> bool:
         """
@@ -229,6 +424,13 @@ class SafariController:
         Returns:
             True if text was pasted successfully
         """
+        modules = _pyobjc()
+        if modules is not None:
+            try:
+                return self._paste_via_quartz(text, *modules)
+            except Exception:
+                pass  # fall back to pbcopy + System Events
+        
         process = subprocess.Popen(['pbcopy'], stdin=subprocess.PIPE)
         process.communicate(text.encode('utf-8'))
         time.sleep(0.2)
@@ -243,6 +445,31 @@ class SafariController:
         success, _ = self.run_applescript(script)
         return success
     
+    def _paste_via_quartz(self, text: str, Quartz, AppKit) -> bool:
+        """
+        Set the pasteboard and post Cmd+V in-process via AppKit/Quartz.
+        
+        Raises RuntimeError when it can't paste, so type_via_clipboard
+        falls back to pbcopy + System Events.
+        """
+        pasteboard = AppKit.NSPasteboard.generalPasteboard()
+        pasteboard.clearContents()
+        if not pasteboard.setString_forType_(text, AppKit.NSPasteboardTypeString):
+            raise RuntimeError("could not set pasteboard string")
+        
+        apps = AppKit.NSRunningApplication.runningApplicationsWithBundleIdentifier_("com.apple.Safari")
+        if not apps:
+            raise RuntimeError("Safari is not running")
+        apps[0].activateWithOptions_(AppKit.NSApplicationActivateIgnoringOtherApps)
+        time.sleep(0.2)
+        
+        source = Quartz.CGEventSourceCreate(Quartz.kCGEventSourceStateHIDSystemState)
+        for key_down in (True, False):
+            event = Quartz.CGEventCreateKeyboardEvent(source, _KEYCODE_V, key_down)
+            Quartz.CGEventSetFlags(event, Quartz.kCGEventFlagMaskCommand)
+            Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+        return True
+    
     def press_enter(self) -> bool:
         """Press Enter key."""
         script = '''
@@ -3,8 +3,13 @@ TikTok Engagement Automation
 Complete automation for TikTok interactions: navigation, likes, comments, follows, and messaging.
 """
 import asyncio
+import json
 import random
+import subprocess
 import sys
+import time
+import uuid
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Any
@@ -16,6 +21,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 from automation.safari_app_controller import SafariAppController
 from automation.tiktok_session_manager import TikTokSessionManager
 from automation.tiktok_login_automation_v2 import TikTokLoginAutomationV2
+from controllers.safari_controller import SafariController
 
 # Import centralized Safari session manager
 try:
@@ -33,6 +39,230 @@ except ImportError:
     EXTENSION_AVAILABLE = False
     SafariExtensionBridge = None
 
+# orjson is optional - several times faster than json for comment payloads
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# Notification scripts prefix their JSON payload with this so results
+# can be told apart from errors/empty output without a try/except
+_JS_OK = "__OK__"
+
+# Response returned (as a copy) by TikTokNotifications reads when logged out
+_NOT_LOGGED_IN = {'success': False, 'error': 'Not logged in'}
+
+# Navigates the front document to argv[1], gives the page 3s to render and
+# runs argv[2] as JS - one osascript process per notifications read.
+_NAV_EXTRACT_APPLESCRIPT = '''
+on run argv
+    tell application "Safari"
+        activate
+        set URL of front document to (item 1 of argv)
+    end tell
+    delay 3
+    tell application "Safari"
+        tell front document
+            return do JavaScript (item 2 of argv)
+        end tell
+    end tell
+end run
+'''
+
+# Generic list extractor used by TikTokNotifications._extract_list; called
+# as (selectors, fields, limit). Each field is [key, selector, mode, fallback]
+# where mode is 'required' (text, item skipped when missing), 'text', 'user'
+# (handle from an /@user link), 'href' or 'exists'.
+_EXTRACT_LIST_JS = """
+(function(selectors, fields, limit) {
+    var out = [];
+    var items = document.querySelectorAll(selectors);
+    for (var i = 0; i < items.length; i++) {
+        if (out.length >= limit) break;
+        var row = {}, keep = true;
+        for (var j = 0; j < fields.length; j++) {
+            var f = fields[j], el = items[i].querySelector(f[1]), v = f[3];
+            if (f[2] === 'exists') v = !!el;
+            else if (el) v = f[2] === 'href' ? el.href
+                : f[2] === 'user' ? el.href.split('/@').pop().split('/')[0]
+                : el.textContent.trim().substring(0, 200);
+            else if (f[2] === 'required') { keep = false; break; }
+            row[f[0]] = v;
+        }
+        if (keep) out.push(row);
+    }
+    return '__OK__' + JSON.stringify(out);
+})"""
+
+# Default location for save_comments output
+SESSIONS_DIR = Path(__file__).parent / "sessions"
+
+# Directories already created by _write_json_file, so repeat saves skip mkdir
+_ready_dirs: set = set()
+
+
+def _write_json_file(filepath: Path, data: Any) -> None:
+    """Write data as pretty-printed UTF-8 JSON, creating the parent dir once."""
+    parent = filepath.parent
+    if parent not in _ready_dirs:
+        parent.mkdir(parents=True, exist_ok=True)
+        _ready_dirs.add(parent)
+    if HAS_ORJSON:
+        filepath.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+# Installed once per page as window.__tk so WebKit parses and JIT-compiles
+# the helpers a single time; actions then send only a short call such as
+# window.__tk.getComments(50) instead of a fresh ~1 KB script.
+#   waitFor(test, ms)  polls test() until truthy or ms elapses, so flows
+#                      resolve on DOM state instead of fixed sleeps
+#   pick(list)         tries ', '-separated fallback selectors in order
+#   grab(node, limit)  collects at most ~limit chars of a node's text, so
+#                      long comment subtrees are not fully concatenated
+#   commentsReady()    opens the comments panel if needed and resolves via a
+#                      MutationObserver once the first comment renders
+#   commentItems()     resolves TikTok's generated DivCommentItemWrapper
+#                      class once (window.__tkCommentCls) and keeps its live
+#                      collection on window.__tkLiveComments, so bulk replies
+#                      index one engine-maintained list instead of re-querying
+_TK_JS_BUNDLE = """
+(function(){
+var tk={};
+tk.waitFor=function(test,ms){return new Promise(function(res){
+var end=Date.now()+ms;
+(function tick(){var v=test();if(v||Date.now()>end)return res(v);setTimeout(tick,50);})();
+});};
+tk.pick=function(list){
+var sels=list.split(', ');
+for(var i=0;i<sels.length;i++){var el=document.querySelector(sels[i].trim());if(el)return el;}
+return null;
+};
+tk.commentItems=function(){
+var live=window.__tkLiveComments;
+if(live&&live.length)return live;
+var first=document.querySelector("[class*=DivCommentItemWrapper]");
+if(!first)return [];
+var cls=null;
+for(var i=0;i<first.classList.length;i++){
+  if(first.classList[i].indexOf("DivCommentItemWrapper")>=0){cls=first.classList[i];break;}
+}
+window.__tkCommentCls=cls;
+window.__tkLiveComments=document.getElementsByClassName(cls);
+return window.__tkLiveComments;
+};
+tk.grab=function(node,limit){
+var out='';
+var stack=[node];
+while(stack.length&&out.length<limit){
+  var x=stack.pop();
+  if(x.nodeType===3){out+=x.data;}
+  else{for(var i=x.childNodes.length-1;i>=0;i--)stack.push(x.childNodes[i]);}
+}
+return out.substring(0,limit).trim();
+};
+tk.getComments=function(limit){
+var c=[];
+var t=document.querySelectorAll('[data-e2e="comment-level-1"]');
+var u=document.querySelectorAll('[data-e2e="comment-username-1"]');
+var n=Math.min(t.length,u.length,limit);
+for(var i=0;i<n;i++){
+var text=tk.grab(t[i],500);
+if(text)c.push({u:u[i].textContent.trim().replace(/^@/,''),t:text});
+}
+return c;
+};
+tk.commentsReady=function(commentButton,ms){return new Promise(function(res){
+var sel='[data-e2e="comment-level-1"]';
+if(document.querySelector(sel))return res('ready');
+var btn=tk.pick(commentButton);
+if(btn)btn.click();
+var obs=new MutationObserver(function(){
+  if(document.querySelector(sel)){obs.disconnect();clearTimeout(timer);res('ready');}
+});
+obs.observe(document.body,{childList:true,subtree:true});
+var timer=setTimeout(function(){obs.disconnect();res('timeout');},ms);
+});};
+tk.replyAt=async function(index,commentButton){
+var items=tk.commentItems();
+if(items.length<=index){
+  var btn=tk.pick(commentButton);
+  if(btn)btn.click();
+  items=await tk.waitFor(function(){
+    var l=tk.commentItems();
+    return l.length>index?l:null;
+  },5000);
+  if(!items)return "no_comment";
+}
+var item=items[index];
+var reply=item.querySelector("[class*=Reply]");
+if(!reply){
+  var spans=item.getElementsByTagName("span");
+  for(var i=0,n=spans.length;i<n;i++){
+    var f=spans[i].firstChild;
+    if(f&&f.nodeType===3&&f.data.trim()==="Reply"){reply=spans[i];break;}
+  }
+}
+if(!reply)return "reply_not_found";
+var before=document.activeElement;
+reply.click();
+await tk.waitFor(function(){
+  var a=document.activeElement;
+  return a&&a!==before&&(a.isContentEditable||a.tagName==="INPUT"||a.tagName==="TEXTAREA");
+},2000);
+return "clicked";
+};
+tk.isSaved=function(){
+var btn=document.querySelector('[data-e2e="bookmark-icon"],[data-e2e="undefined-icon"]');
+if(!btn)return 'no_button';
+var parent=btn.closest('button');
+if(!parent)parent=btn.parentElement;
+var pressed=parent.getAttribute('aria-pressed');
+if(pressed==='true')return 'saved';
+var cls=parent.className||'';
+var svg=btn.querySelector('svg');
+var fill=svg?svg.getAttribute('fill'):'';
+if(cls.includes('active')||cls.includes('saved')||fill.includes('#')||fill!=='currentColor')return 'saved';
+return 'not_saved';
+};
+tk.share=async function(shareButton,copyLink){
+var share=tk.pick(shareButton);
+if(!share)return 'not_found';
+share.click();
+if(!copyLink)return 'opened';
+var btn=await tk.waitFor(function(){
+var b=document.querySelector('[data-e2e="share-copy-link"],button[aria-label*="Copy link"],button[aria-label*="copy link"],div[data-e2e="copy-link"]');
+if(b)return b;
+var root=document.querySelector('[role="dialog"],[data-e2e*="share"]')||document;
+var tags=['button','div'];
+for(var t=0;t<tags.length;t++){
+  var els=root.getElementsByTagName(tags[t]);
+  for(var i=0,n=els.length;i<n;i++){
+    var el=els[i];
+    if(t===1&&el.getAttribute('role')!=='button')continue;
+    var text=el.textContent.trim();
+    if(text==='Copy link'||(text.length<40&&text.toLowerCase().indexOf('copy link')>=0))return el;
+  }
+}
+return null;
+},3000);
+if(btn){btn.click();return 'copied';}
+return 'opened';
+};
+window.__tk=tk;
+return 'installed';
+})();
+"""
+
+# Returned by _call_tk probes when a navigation has wiped window.__tk
+_TK_MISSING = "__tk_missing__"
+
 
 class TikTokEngagement:
     """
@@ -113,6 +343,13 @@ class TikTokEngagement:
         "message_input_bar": '[class*="DivMessageInputAndSendButton"]',
     }
     
+    # Buffered actions (see _record_action) are flushed to the session
+    # manager once this many are pending
+    ACTION_FLUSH_EVERY = 10
+    
+    # Seconds an is_video_saved result is reused for the same URL
+    SAVED_CACHE_TTL = 2.0
+    
     def __init__(self, 
                  browser_type: str = "safari",
                  auto_restore_session: bool = True):
@@ -128,8 +365,15 @@ class TikTokEngagement:
         
         # Controllers
         self.safari_controller: Optional[SafariAppController] = None
+        # Runs _run_js through its resident osascript worker; the lock keeps
+        # concurrent calls from interleaving on the worker's pipes
+        self._js_runner = SafariController()
+        self._js_lock = asyncio.Lock()
         self.login_automation: Optional[TikTokLoginAutomationV2] = None
         self.session_manager = TikTokSessionManager()
+        self._pending_actions: deque = deque()
+        # url -> (checked_at, is_saved); cleared by save_video / navigation
+        self._saved_cache: Dict[str, tuple] = {}
         
         # Extension bridge (for Draft.js typing)
         self.extension_bridge: Optional[SafariExtensionBridge] = None
@@ -207,6 +451,9 @@ class TikTokEngagement:
             # Check login status
             await self.check_login_status()
             
+            # Install the window.__tk helper bundle up front
+            await self._install_js_bundle()
+            
             logger.success("✅ TikTok Engagement started")
             return True
             
@@ -261,7 +508,7 @@ class TikTokEngagement:
         """
         try:
             # Rate limit check
-            if not self.session_manager.can_perform_action("navigation"):
+            if not self._can_perform_action("navigation"):
                 logger.warning("Rate limit reached for navigation")
                 return False
             
@@ -282,6 +529,7 @@ class TikTokEngagement:
                 await self.login_automation.page.goto(url)
             
             self.current_url = url
+            self._saved_cache.clear()
             page_type = self.session_manager.detect_page_type(url)
             self.session_manager.update_state(page_type=page_type, current_url=url)
             self.session_manager.add_action("navigation", {"url": url, "page_type": page_type})
@@ -419,9 +667,8 @@ class TikTokEngagement:
             
             result = await self._run_js(js_code)
             if result:
-                import json
                 try:
-                    return json.loads(result)
+                    return _json_loads(result)
                 except json.JSONDecodeError:
                     pass
             
@@ -453,7 +700,7 @@ class TikTokEngagement:
             True if like was successful.
         """
         try:
-            if not self.session_manager.can_perform_action("like"):
+            if not self._can_perform_action("like"):
                 logger.warning("Rate limit reached for likes")
                 return False
             
@@ -532,7 +779,7 @@ class TikTokEngagement:
             Dict with success status, posted text, and verification result
         """
         try:
-            if not self.session_manager.can_perform_action("comment"):
+            if not self._can_perform_action("comment"):
                 logger.warning("Rate limit reached for comments")
                 return {"success": False, "error": "rate_limit", "text": text}
             
@@ -627,28 +874,11 @@ class TikTokEngagement:
         try:
             await asyncio.sleep(2)  # Wait for comment to appear
             
-            # Get first few comments from the top
-            js_code = """
-            (function() {
-                var comments = [];
-                var items = document.querySelectorAll('[data-e2e="comment-level-1"]');
-                for (var i = 0; i < Math.min(5, items.length); i++) {
-                    var item = items[i];
-                    var wrapper = item.closest('div[class*="Comment"]');
-                    if (!wrapper) wrapper = item.parentElement.parentElement;
-                    var userEl = wrapper ? wrapper.querySelector('[data-e2e="comment-username-1"]') : null;
-                    if (!userEl) userEl = wrapper ? wrapper.querySelector('a[href*="/@"]') : null;
-                    var username = userEl ? userEl.textContent.trim().replace('@', '') : 'unknown';
-                    var text = item.textContent.trim();
-                    comments.push({username: username, text: text, index: i});
-                }
-                return JSON.stringify(comments);
-            })();
-            """
+            # Get first few comments from the top (same single-pass zip
+            # of text and username nodes as get_comments)
+            raw_comments = await self._call_tk_data("getComments(5)")
             
-            result = await self._run_js(js_code)
-            
-            if not result or result == "[]":
+            if not raw_comments:
                 return {
                     "verified": False,
                     "found_at_top": False,
@@ -657,17 +887,7 @@ class TikTokEngagement:
                     "top_comments": []
                 }
             
-            import json
-            try:
-                comments = json.loads(result)
-            except:
-                return {
-                    "verified": False,
-                    "found_at_top": False,
-                    "username_match": False,
-                    "error": "Failed to parse comments",
-                    "top_comments": []
-                }
+            comments = [{"username": c.get("u", ""), "text": c.get("t", ""), "index": i} for i, c in enumerate(raw_comments)]
             
             # Check if our comment is at the top
             found_at_top = False
@@ -764,52 +984,18 @@ return 'not_found';
         try:
             await asyncio.sleep(delay)
             
-            # Step 1: Open comments panel if not already open
-            await self.open_comments()
-            await asyncio.sleep(1)
-            
-            # Step 2: Find and click Reply button on the specific comment
-            # Reply buttons are inside each comment item wrapper
-            # Using class*= selector pattern from reference
-            reply_js = f'''(function(){{
-var items=document.querySelectorAll("[class*=DivCommentItemWrapper]");
-if(items.length<={comment_index})return "no_comment";
-var item=items[{comment_index}];
-var reply=item.querySelector("span:contains('Reply'),button:contains('Reply'),[class*=Reply]");
-if(!reply){{
-  var spans=item.querySelectorAll("span");
-  for(var i=0;i<spans.length;i++){{
-    if(spans[i].textContent.trim()==="Reply"){{reply=spans[i];break;}}
-  }}
-}}
-if(reply){{reply.click();return "clicked";}}
-return "reply_not_found";
-}})()'''
-            
-            result = await self._run_js(reply_js)
+            # Steps 1-2 in one round trip: open the comments panel if it is
+            # not already open, wait for the target comment to render, click
+            # its Reply button and wait for the reply input to take focus.
+            result = await self._call_tk(
+                f"replyAt({comment_index}, {json.dumps(self.SELECTORS['comment_button'])})",
+                is_async=True,
+                timeout=10
+            )
             
             if result != "clicked":
                 logger.warning(f"Could not click Reply button: {result}")
-                # Fallback: try to click Reply by text content matching
-                fallback_js = f'''(function(){{
-var items=document.querySelectorAll("[class*=DivCommentItemWrapper]");
-if(items.length<={comment_index})return "no_comment";
-var item=items[{comment_index}];
-var spans=item.querySelectorAll("span");
-for(var i=0;i<spans.length;i++){{
-  if(spans[i].textContent.trim()==="Reply"){{
-    spans[i].click();
-    return "clicked";
-  }}
-}}
-return "reply_not_found";
-}})()'''
-                result = await self._run_js(fallback_js)
-            
-            if result != "clicked":
                 return {"success": False, "error": result}
-                
-            await asyncio.sleep(0.5)
             
             # Step 3: Type the reply text (input should now be focused on this comment thread)
             await self._type_text(reply_text)
@@ -819,12 +1005,13 @@ return "reply_not_found";
             post_clicked = await self._click_element(self.SELECTORS["comment_post"])
             
             if post_clicked:
-                self.session_manager.add_action("reply_comment", {
+                self._record_action("reply_comment", {
                     "url": self.current_url,
                     "comment_index": comment_index,
                     "text": reply_text[:100],
                 })
-                logger.info(f"↩️ Replied to comment {comment_index}: {reply_text[:30]}...")
+                # Lazy args: loguru skips formatting when INFO is filtered out
+                logger.info("↩️ Replied to comment {}: {}...", comment_index, reply_text[:30])
                 return {"success": True, "text": reply_text, "comment_index": comment_index}
             
             return {"success": False, "error": "post_button_not_clicked"}
@@ -845,45 +1032,26 @@ return "reply_not_found";
             List of comment dicts with username, text, likes
         """
         try:
-            # Make sure comments are open
-            await self.open_comments()
-            await asyncio.sleep(3)  # Wait for comments to fully load
+            # Make sure comments are open, resolving as soon as the first
+            # comment renders rather than after a fixed wait
+            ready = await self._call_tk(
+                f"commentsReady({json.dumps(self.SELECTORS['comment_button'])}, 5000)",
+                is_async=True,
+                timeout=7
+            )
+            if ready != "ready":
+                logger.debug(f"Comments not rendered before extraction: {ready}")
             
-            # JavaScript to extract comments using TikTok's data-e2e attributes
+            # Extract comments using TikTok's data-e2e attributes
             # Key selectors found via DOM inspection:
             # - comment-level-1: the comment text span
             # - comment-username-1: the username div
-            js_code = f"""
-(function(){{
-var c=[];
-var items=document.querySelectorAll('[data-e2e="comment-level-1"]');
-items.forEach(function(item,i){{
-if(i>={limit})return;
-var wrapper=item.closest('div[class*="Comment"]');
-if(!wrapper)wrapper=item.parentElement.parentElement;
-var userEl=wrapper?wrapper.querySelector('[data-e2e="comment-username-1"]'):null;
-if(!userEl)userEl=wrapper?wrapper.querySelector('a[href*="/@"]'):null;
-var u=userEl?userEl.textContent.trim():'unknown';
-u=u.replace(/^@/,'');
-var t=item.textContent.trim();
-if(t)c.push({{u:u,t:t.substring(0,500)}});
-}});
-return JSON.stringify(c);
-}})();
-            """
-            
-            result = await self._run_js(js_code)
+            raw_comments = await self._call_tk_data(f"getComments({int(limit)})")
             
-            if result and result != "[]":
-                import json
-                try:
-                    raw_comments = json.loads(result)
-                    comments = [{"username": c.get("u", ""), "text": c.get("t", ""), "likes": "0", "index": i} for i, c in enumerate(raw_comments)]
-                    logger.info(f"📝 Retrieved {len(comments)} comments")
-                    return comments
-                except json.JSONDecodeError as e:
-                    logger.warning(f"⚠️ Failed to parse comments JSON: {e}")
-                    return []
+            if raw_comments:
+                comments = [{"username": c.get("u", ""), "text": c.get("t", ""), "likes": "0", "index": i} for i, c in enumerate(raw_comments)]
+                logger.info(f"📝 Retrieved {len(comments)} comments")
+                return comments
             else:
                 logger.warning("⚠️ No comments found - comments panel may not be open or video has no comments")
                 return []
@@ -912,10 +1080,9 @@ return JSON.stringify(c);
             # Generate default filepath if not provided
             if not filepath:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filepath = str(Path(__file__).parent / "sessions" / f"comments_{timestamp}.json")
+                filepath = str(SESSIONS_DIR / f"comments_{timestamp}.json")
             
             # Prepare data to save
-            import json
             save_data = {
                 "video_url": self.current_url,
                 "saved_at": datetime.now().isoformat(),
@@ -923,12 +1090,8 @@ return JSON.stringify(c);
                 "comments": comments
             }
             
-            # Ensure directory exists
-            Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-            
-            # Save to file
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(save_data, f, indent=2, ensure_ascii=False)
+            # Save to file off the event loop
+            await asyncio.to_thread(_write_json_file, Path(filepath), save_data)
             
             logger.success(f"💾 Saved {len(comments)} comments to {filepath}")
             
@@ -954,35 +1117,19 @@ return JSON.stringify(c);
             Dict with share status and video URL.
         """
         try:
-            # Click share button
-            await self._click_element(self.SELECTORS["share_button"])
-            await asyncio.sleep(1.5)
+            # Open the share menu and, once its Copy link button renders,
+            # click it - all in one round trip
+            result = await self._call_tk(
+                f"share({json.dumps(self.SELECTORS['share_button'])}, {str(copy_link).lower()})",
+                is_async=True,
+                timeout=8
+            )
             
             video_url = self.current_url
-            link_copied = False
+            link_copied = result == "copied"
             
-            if copy_link:
-                # Try to click "Copy link" button in share menu
-                copy_link_js = """
-(function(){
-var btn=document.querySelector('[data-e2e="share-copy-link"]');
-if(!btn)btn=document.querySelector('button[aria-label*="Copy link"],button[aria-label*="copy link"],div[data-e2e="copy-link"]');
-if(!btn){
-  var btns=document.querySelectorAll('button,div[role="button"]');
-  for(var i=0;i<btns.length;i++){
-    if(btns[i].textContent.toLowerCase().includes('copy link')){btn=btns[i];break;}
-  }
-}
-if(btn){btn.click();return 'clicked';}
-return 'not_found';
-})();
-                """
-                result = await self._run_js(copy_link_js)
-                link_copied = result == "clicked" if result else False
-                await asyncio.sleep(0.5)
-                
-                if link_copied:
-                    logger.info("🔗 Link copied to clipboard")
+            if link_copied:
+                logger.info("🔗 Link copied to clipboard")
             
             self.session_manager.add_action("share", {"url": video_url, "link_copied": link_copied})
             logger.info(f"📤 Share menu opened{' and link copied' if link_copied else ''}")
@@ -1003,6 +1150,7 @@ return 'not_found';
         try:
             # Click the save/bookmark button
             result = await self._click_element(self.SELECTORS["save_button"])
+            self._saved_cache.clear()
             
             if result:
                 await asyncio.sleep(0.5)
@@ -1025,24 +1173,15 @@ return 'not_found';
             True if video is saved.
         """
         try:
+            cached = self._saved_cache.get(self.current_url)
+            if cached and time.monotonic() - cached[0] < self.SAVED_CACHE_TTL:
+                return cached[1]
+            
             # Check if save button is in "saved" state (usually has aria-pressed or class change)
-            js_code = """
-(function(){
-var btn=document.querySelector('[data-e2e="bookmark-icon"],[data-e2e="undefined-icon"]');
-if(!btn)return 'no_button';
-var parent=btn.closest('button');
-if(!parent)parent=btn.parentElement;
-var pressed=parent.getAttribute('aria-pressed');
-if(pressed==='true')return 'saved';
-var cls=parent.className||'';
-var svg=btn.querySelector('svg');
-var fill=svg?svg.getAttribute('fill'):'';
-if(cls.includes('active')||cls.includes('saved')||fill.includes('#')||fill!=='currentColor')return 'saved';
-return 'not_saved';
-})();
-            """
-            result = await self._run_js(js_code)
-            return result == "saved" if result else False
+            result = await self._call_tk("isSaved()")
+            saved = result == "saved" if result else False
+            self._saved_cache[self.current_url] = (time.monotonic(), saved)
+            return saved
         except:
             return False
     
@@ -1057,7 +1196,7 @@ return 'not_saved';
             True if follow was successful.
         """
         try:
-            if not self.session_manager.can_perform_action("follow"):
+            if not self._can_perform_action("follow"):
                 logger.warning("Rate limit reached for follows")
                 return False
             
@@ -1112,7 +1251,7 @@ return 'not_saved';
             True if message was sent.
         """
         try:
-            if not self.session_manager.can_perform_action("message"):
+            if not self._can_perform_action("message"):
                 logger.warning("Rate limit reached for messages")
                 return False
             
@@ -1162,6 +1301,8 @@ return 'not_saved';
             True if session was saved.
         """
         try:
+            self._flush_actions()
+            
             # Save cookies
             if self.safari_controller:
                 await self.session_manager.save_cookies_from_safari()
@@ -1170,8 +1311,9 @@ return 'not_saved';
                     self.login_automation.context
                 )
             
-            # Save state
-            self.session_manager.save_state_to_file()
+            # Save state once the cookies are stored; the write runs in a
+            # thread so it doesn't block the event loop
+            await asyncio.to_thread(self.session_manager.save_state_to_file)
             
             logger.success("✅ Session saved")
             return True
@@ -1192,7 +1334,7 @@ return 'not_saved';
             "is_logged_in": self.is_logged_in,
             "current_url": self.current_url,
             "browser_type": self.browser_type,
-            "session": self.session_manager.get_current_state()
+            "session": self._flushed_session_manager().get_current_state()
         }
     
     def get_action_history(self, limit: int = 50) -> List[Dict]:
@@ -1205,10 +1347,37 @@ return 'not_saved';
         Returns:
             List of action records.
         """
-        return self.session_manager.get_action_history(limit=limit)
+        return self._flushed_session_manager().get_action_history(limit=limit)
     
     # ==================== Helper Methods ====================
     
+    def _record_action(self, action_type: str, details: Dict) -> None:
+        """
+        Buffer an action for the session manager.
+        
+        Used on hot paths such as bulk replies so each action does not pay
+        for a session-manager write; the buffer is flushed every
+        ACTION_FLUSH_EVERY actions and before anything reads the history.
+        """
+        self._pending_actions.append((action_type, details))
+        if len(self._pending_actions) >= self.ACTION_FLUSH_EVERY:
+            self._flush_actions()
+    
+    def _flush_actions(self) -> None:
+        """Hand buffered actions to the session manager in order."""
+        while self._pending_actions:
+            action_type, details = self._pending_actions.popleft()
+            self.session_manager.add_action(action_type, details)
+    
+    def _flushed_session_manager(self) -> TikTokSessionManager:
+        """Return the session manager with all buffered actions applied."""
+        self._flush_actions()
+        return self.session_manager
+    
+    def _can_perform_action(self, action_type: str) -> bool:
+        """Rate-limit check that sees buffered actions too."""
+        return self._flushed_session_manager().can_perform_action(action_type)
+    
     async def _run_js(self, js_code: str) -> str:
         """
         Run JavaScript in the browser.
@@ -1221,16 +1390,15 @@ return 'not_saved';
         """
         try:
             if self.safari_controller:
-                script = f'''
-                tell application "Safari"
-                    tell front window
-                        tell current tab
-                            do JavaScript "{js_code.replace('"', '\\"').replace(chr(10), ' ')}"
-                        end tell
-                    end tell
-                end tell
-                '''
-                return self.safari_controller._run_applescript(script)
+                # Through the resident osascript worker, so repeated calls
+                # (e.g. _run_js_async polls) skip the osascript fork/exec,
+                # in a thread so the event loop is not blocked meanwhile
+                async with self._js_lock:
+                    result = await asyncio.to_thread(self._js_runner.execute_js, js_code)
+                if result is None:
+                    logger.debug("JS execution failed")
+                    return ""
+                return result
             elif self.login_automation and self.login_automation.page:
                 return await self.login_automation.page.evaluate(js_code)
             return ""
@@ -1238,6 +1406,145 @@ return 'not_saved';
             logger.debug(f"JS execution error: {e}")
             return ""
     
+    async def _run_js_async(self, js_body: str, timeout: float = 10.0) -> str:
+        """
+        Run an async JavaScript function body and return its resolved value.
+        
+        The body may use await. Safari's do JavaScript cannot await a
+        Promise, so the body runs detached, parks its result as JSON under
+        a per-call key of window.__tkResult, and that slot is polled with
+        back-off (and deleted once read). Overlapping calls each get their
+        own slot, and the JSON envelope keeps a body resolving to ""
+        distinct from "not done".
+        
+        Args:
+            js_body: Body of an async function; its return value is the result
+            timeout: Seconds to wait for the body to resolve
+            
+        Returns:
+            Result string, "timeout" if it never resolved, or "" on error.
+        """
+        js_func = f"(async function(){{{js_body}}})()"
+        try:
+            if self.safari_controller:
+                slot = f"window.__tkResult['{uuid.uuid4().hex}']"
+                started = await self._run_js(
+                    "window.__tkResult=window.__tkResult||{};"
+                    f"{slot}=null;"
+                    f"{js_func}.then("
+                    f"function(r){{if({slot}===null){slot}=JSON.stringify({{v:String(r)}});}},"
+                    f"function(e){{if({slot}===null){slot}=JSON.stringify({{v:'error: '+e.message}});}});"
+                    "'started'"
+                )
+                if started != "started":
+                    return ""
+                
+                # Polls go through the resident worker (no osascript per
+                # poll) and back off, so long waits stay a handful of calls
+                loop = asyncio.get_running_loop()
+                deadline = loop.time() + timeout
+                interval = 0.05
+                while loop.time() < deadline:
+                    result = await self._run_js(
+                        f"(function(){{var r={slot};if(!r)return '';"
+                        f"delete {slot};return r;}})()"
+                    )
+                    if result:
+                        return json.loads(result)["v"]
+                    await asyncio.sleep(min(interval, max(deadline - loop.time(), 0)))
+                    interval = min(interval * 2, 1.0)
+                # Free the slot; a late resolution finds it gone and is dropped
+                await self._run_js(f"delete {slot};''")
+                return "timeout"
+            elif self.login_automation and self.login_automation.page:
+                result = await asyncio.wait_for(
+                    self.login_automation.page.evaluate(js_func), timeout=timeout
+                )
+                return str(result)
+            return ""
+        except asyncio.TimeoutError:
+            return "timeout"
+        except Exception as e:
+            logger.debug(f"Async JS execution error: {e}")
+            return ""
+    
+    async def _install_js_bundle(self) -> bool:
+        """
+        Install the window.__tk helper bundle in the current page.
+        
+        Returns:
+            True if the bundle was installed.
+        """
+        return await self._run_js(_TK_JS_BUNDLE) == "installed"
+    
+    async def _call_tk(self, call: str, is_async: bool = False, timeout: float = 10.0) -> str:
+        """
+        Call a window.__tk helper, reinstalling the bundle if it is missing.
+        
+        Full page loads wipe window.__tk, so a missing bundle is detected
+        with a sentinel and the call is retried once after reinstalling.
+        
+        Args:
+            call: Helper call expression, e.g. "getComments(20)"
+            is_async: If True, await the helper's Promise via _run_js_async
+            timeout: Seconds to wait for an async helper to resolve
+            
+        Returns:
+            Result string from the helper.
+        """
+        for _ in range(2):
+            if is_async:
+                result = await self._run_js_async(
+                    f"if(!window.__tk)return '{_TK_MISSING}';return await window.__tk.{call};",
+                    timeout=timeout
+                )
+            else:
+                result = await self._run_js(
+                    f"window.__tk?String(window.__tk.{call}):'{_TK_MISSING}'"
+                )
+            if result != _TK_MISSING:
+                return result
+            await self._install_js_bundle()
+        return ""
+    
+    async def _call_tk_data(self, call: str) -> Any:
+        """
+        Call a window.__tk helper that returns plain data (arrays/objects).
+        
+        Playwright marshals the value natively, so it is returned as-is.
+        Safari's do JavaScript only returns strings, so the value crosses
+        as a single JSON.stringify and is parsed once here.
+        
+        Args:
+            call: Helper call expression, e.g. "getComments(20)"
+            
+        Returns:
+            The helper's value, or None if it could not be retrieved.
+        """
+        if self.safari_controller:
+            expr = f"JSON.stringify(window.__tk.{call})"
+        else:
+            expr = f"window.__tk.{call}"
+        
+        for _ in range(2):
+            result = await self._run_js(f"window.__tk?{expr}:'{_TK_MISSING}'")
+            if result != _TK_MISSING:
+                break
+            await self._install_js_bundle()
+        else:
+            return None
+        
+        if not isinstance(result, str):
+            return result
+        if not result:
+            return None
+        try:
+            return _json_loads(result)
+        except json.JSONDecodeError as e:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            logger.warning(f"⚠️ Failed to parse {call} JSON: {e}")
+            return None
+    
     async def _click_element(self, selector: str) -> bool:
         """
         Click an element by selector.
@@ -1250,10 +1557,12 @@ return 'not_saved';
         """
         try:
             if self.safari_controller:
-                # Use JavaScript to click
+                # Use JavaScript to click, trying the ', '-separated
+                # fallbacks in priority order like tk.pick and the
+                # Playwright branch below
                 js_code = f"""
                 (function() {{
-                    var selectors = '{selector}'.split(', ');
+                    var selectors = {json.dumps(selector)}.split(', ');
                     for (var i = 0; i < selectors.length; i++) {{
                         var el = document.querySelector(selectors[i].trim());
                         if (el) {{
@@ -1267,15 +1576,21 @@ return 'not_saved';
                 result = await self._run_js(js_code)
                 return 'clicked' in result.lower()
             elif self.login_automation and self.login_automation.page:
-                # Try each selector
-                for sel in selector.split(", "):
-                    try:
-                        element = await self.login_automation.page.query_selector(sel.strip())
-                        if element:
+                # Query every fallback concurrently (one IPC round trip
+                # instead of one per selector), then click the leftmost hit
+                # so selector priority is preserved
+                page = self.login_automation.page
+                candidates = await asyncio.gather(
+                    *(page.query_selector(sel.strip()) for sel in selector.split(", ")),
+                    return_exceptions=True
+                )
+                for element in candidates:
+                    if element and not isinstance(element, Exception):
+                        try:
                             await element.click()
                             return True
-                    except:
-                        continue
+                        except:
+                            continue
             return False
         except Exception as e:
             logger.debug(f"Click error: {e}")
@@ -1339,6 +1654,8 @@ return 'not_saved';
             if self.login_automation:
                 await self.login_automation.cleanup()
             
+            self._js_runner.close()
+            
             logger.info("🧹 Cleanup complete")
         except Exception as e:
             logger.debug(f"Cleanup error: {e}")
@@ -1394,16 +1711,31 @@ class TikTokNotifications:
     
     INBOX_URL = "https://www.tiktok.com/inbox"
     ACTIVITY_URL = "https://www.tiktok.com/activity"
+    ALL_ACTIVITY_URL = "https://www.tiktok.com/inbox?tab=all"
+    
+    # Item selectors and per-item fields for _extract_list
+    NOTIFICATION_SELECTORS = '[class*="NotificationItem"], [class*="DivItemContainer"], [data-e2e*="notification"]'
+    NOTIFICATION_FIELDS = {
+        'text': ('[class*="Content"], span', 'required', None),
+        'user': ('a[href*="/@"]', 'user', None),
+        'time': ('[class*="Time"], time', 'text', None),
+        'type': ('[class*="Type"]', 'text', 'activity'),
+    }
+    ACTIVITY_SELECTORS = '[class*="ItemContainer"], [class*="NotificationItem"], article'
+    ACTIVITY_FIELDS = {
+        'content': ('[class*="Content"], span', 'required', None),
+        'has_avatar': ('img[class*="Avatar"]', 'exists', None),
+        'video_link': ('a[href*="/video/"]', 'href', None),
+    }
     
     def __init__(self):
         self.session_manager = SafariSessionManager() if HAS_SAFARI_SESSION_MANAGER else None
     
-    def _run_applescript(self, script: str) -> tuple:
-        """Execute AppleScript."""
-        import subprocess
+    def _run_applescript(self, script: str, *args: str) -> tuple:
+        """Execute AppleScript, passing args to its run handler as argv."""
         try:
             result = subprocess.run(
-                ["osascript", "-e", script],
+                ["osascript", "-e", script, *args],
                 capture_output=True,
                 text=True,
                 timeout=60
@@ -1420,6 +1752,37 @@ class TikTokNotifications:
             return self.session_manager.require_login(Platform.TIKTOK)
         return True
     
+    def _extract_list(self, url: str, selectors: str, field_map: Dict[str, tuple], limit: int) -> tuple:
+        """
+        Navigate to url and extract up to limit items matching selectors.
+        
+        Args:
+            url: Page to load before extracting
+            selectors: Combined item selector, matched in one traversal
+            field_map: key -> (selector, mode, fallback), see _EXTRACT_LIST_JS
+            limit: Maximum items to return
+        
+        Returns:
+            Tuple of (success, output) from _run_applescript
+        """
+        fields = [[key, *spec] for key, spec in field_map.items()]
+        js = f"{_EXTRACT_LIST_JS}({json.dumps(selectors)}, {json.dumps(fields)}, {int(limit)})"
+        return self._run_applescript(_NAV_EXTRACT_APPLESCRIPT, url, js)
+    
+    @staticmethod
+    def _list_result(key: str, success: bool, result: str) -> Dict:
+        """Build the response dict for an _extract_list read."""
+        if not success:
+            return {'success': False, 'error': result}
+        if result.startswith(_JS_OK):
+            try:
+                items = _json_loads(result[len(_JS_OK):])
+            except ValueError:
+                # Truncated or otherwise mangled osascript output
+                return {'success': False, 'error': 'Malformed list payload', 'raw': result}
+            return {'success': True, 'count': len(items), key: items}
+        return {'success': True, 'count': 0, key: [], 'raw': result}
+    
     def get_notifications(self, limit: int = 20) -> Dict:
         """
         Get recent notifications from TikTok inbox.
@@ -1431,65 +1794,13 @@ class TikTokNotifications:
             Dict with notifications list
         """
         if not self.require_login():
-            return {'success': False, 'error': 'Not logged in'}
-        
-        # Navigate to inbox
-        nav_script = f'''
-        tell application "Safari"
-            activate
-            set URL of front document to "{self.INBOX_URL}"
-        end tell
-        '''
-        self._run_applescript(nav_script)
-        time.sleep(3)
-        
-        # Extract notifications
-        script = f'''
-        tell application "Safari"
-            tell front document
-                do JavaScript "
-                    (function() {{
-                        var notifications = [];
-                        var items = document.querySelectorAll('[class*=\\"NotificationItem\\"], [class*=\\"DivItemContainer\\"], [data-e2e*=\\"notification\\"]');
-                        
-                        for (var i = 0; i < Math.min(items.length, {limit}); i++) {{
-                            var item = items[i];
-                            var textEl = item.querySelector('[class*=\\"Content\\"], span');
-                            var userEl = item.querySelector('a[href*=\\"/@\\"]');
-                            var timeEl = item.querySelector('[class*=\\"Time\\"], time');
-                            var typeEl = item.querySelector('[class*=\\"Type\\"]');
-                            
-                            if (textEl) {{
-                                notifications.push({{
-                                    text: textEl.innerText.substring(0, 200),
-                                    user: userEl ? userEl.href.split('/@').pop().split('/')[0] : null,
-                                    time: timeEl ? timeEl.innerText : null,
-                                    type: typeEl ? typeEl.innerText : 'activity'
-                                }});
-                            }}
-                        }}
-                        
-                        return JSON.stringify(notifications);
-                    }})();
-                "
-            end tell
-        end tell
-        '''
-        success, result = self._run_applescript(script)
+            return _NOT_LOGGED_IN.copy()
         
-        if success:
-            try:
-                import json
-                notifications = json.loads(result)
-                return {
-                    'success': True,
-                    'count': len(notifications),
-                    'notifications': notifications
-                }
-            except:
-                return {'success': True, 'count': 0, 'notifications': [], 'raw': result}
+        success, result = self._extract_list(
+            self.INBOX_URL, self.NOTIFICATION_SELECTORS, self.NOTIFICATION_FIELDS, limit
+        )
         
-        return {'success': False, 'error': result}
+        return self._list_result('notifications', success, result)
     
     def get_all_activity(self, limit: int = 20) -> Dict:
         """
@@ -1499,63 +1810,13 @@ class TikTokNotifications:
             Dict with activity items
         """
         if not self.require_login():
-            return {'success': False, 'error': 'Not logged in'}
-        
-        # Navigate to activity page (All Activity tab)
-        nav_script = '''
-        tell application "Safari"
-            activate
-            set URL of front document to "https://www.tiktok.com/inbox?tab=all"
-        end tell
-        '''
-        self._run_applescript(nav_script)
-        time.sleep(3)
-        
-        # Extract activity
-        script = f'''
-        tell application "Safari"
-            tell front document
-                do JavaScript "
-                    (function() {{
-                        var activities = [];
-                        var items = document.querySelectorAll('[class*=\\"ItemContainer\\"], [class*=\\"NotificationItem\\"], article');
-                        
-                        for (var i = 0; i < Math.min(items.length, {limit}); i++) {{
-                            var item = items[i];
-                            var contentEl = item.querySelector('[class*=\\"Content\\"], span');
-                            var avatarEl = item.querySelector('img[class*=\\"Avatar\\"]');
-                            var linkEl = item.querySelector('a[href*=\\"/video/\\"]');
-                            
-                            if (contentEl) {{
-                                activities.push({{
-                                    content: contentEl.innerText.substring(0, 200),
-                                    has_avatar: !!avatarEl,
-                                    video_link: linkEl ? linkEl.href : null
-                                }});
-                            }}
-                        }}
-                        
-                        return JSON.stringify(activities);
-                    }})();
-                "
-            end tell
-        end tell
-        '''
-        success, result = self._run_applescript(script)
+            return _NOT_LOGGED_IN.copy()
         
-        if success:
-            try:
-                import json
-                activities = json.loads(result)
-                return {
-                    'success': True,
-                    'count': len(activities),
-                    'activities': activities
-                }
-            except:
-                return {'success': True, 'count': 0, 'activities': [], 'raw': result}
+        success, result = self._extract_list(
+            self.ALL_ACTIVITY_URL, self.ACTIVITY_SELECTORS, self.ACTIVITY_FIELDS, limit
+        )
         
-        return {'success': False, 'error': result}
+        return self._list_result('activities', success, result)
 
 
 # ==================== Main / Test ====================
@@ -23,6 +23,27 @@ from dataclasses import dataclass, field
 from .safari_controller import SafariController
 from .ai_comment_generator import AICommentGenerator
 
+# orjson is optional - faster parsing for tweet + replies payloads
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# JS snippets prefix their JSON payload with this so results can be
+# told apart from errors/empty output without a try/except
+_JS_OK = "__OK__"
+
+
+def _parse(result: Optional[str]) -> dict:
+    """Parse a sentinel-prefixed JS result, returning {} for anything else."""
+    if result and result.startswith(_JS_OK):
+        return _json_loads(result[len(_JS_OK):])
+    return {}
+
 
 @dataclass
 class TwitterEngagementResult:
@@ -50,22 +71,39 @@ class TwitterEngagement:
     3. Click into tweet to see replies
     4. Extract tweet + replies
     5. Generate contextual AI comment
-    6. Post reply
-    7. Capture proof screenshot
+    6. Like the tweet and open the reply composer
+    7. Post reply
+    8. Capture proof screenshot
     """
     
     TWITTER_URL = "https://x.com/home"
     
-    # JavaScript to find a tweet in the feed
+    # Readiness probes polled via SafariController.wait_for_js
+    # Matches on TWITTER_URL too, so the previous x.com page (e.g. a tweet
+    # from the last run) can't pass before the navigation commits
+    JS_FEED_READY = """location.href.indexOf(%s) === 0 && document.readyState === 'complete' && !!document.querySelector('article[data-testid="tweet"]') && location.href""" % json.dumps(TWITTER_URL)
+    JS_REPLIES_READY = """location.pathname.indexOf('/status/') >= 0 && document.querySelectorAll('article[data-testid="tweet"]').length > 1"""
+    JS_COMPOSER_CLOSED = """!document.querySelector('[data-testid="tweetButton"]')"""
+    JS_COMPOSER_OPEN = """!!document.querySelector('[data-testid="tweetTextarea_0"], #layers [contenteditable="true"]')"""
+    JS_INPUT_FOCUSED = """!!(document.activeElement && document.activeElement.isContentEditable)"""
+    JS_SUBMITTABLE = """(function() {
+        var b = document.querySelector('[data-testid="tweetButton"], [data-testid="tweetButtonInline"]');
+        return !!b && !b.disabled && b.getAttribute('aria-disabled') !== 'true';
+    })()"""
+    
+    # JavaScript to find a tweet in the feed and click into it
     JS_FIND_TWEET = '''
     (function() {
-        // Find tweets in the timeline - try multiple selectors
-        var tweets = document.querySelectorAll('article[data-testid="tweet"]');
-        if (!tweets.length) {
-            tweets = document.querySelectorAll('article[role="article"]');
-        }
-        if (!tweets.length) {
-            tweets = document.querySelectorAll('[data-testid="cellInnerDiv"] article');
+        var RE_USER = /^\\/[a-zA-Z0-9_]+$/;
+        var RE_AT = /@([a-zA-Z0-9_]{1,15})/;
+        
+        // Find tweets in the timeline - all selectors in one traversal,
+        // skipping articles nested inside an already matched one
+        var matches = document.querySelectorAll('article[data-testid="tweet"], article[role="article"], [data-testid="cellInnerDiv"] article');
+        var tweets = [];
+        for (var k = 0; k < matches.length; k++) {
+            var parent = matches[k].parentElement;
+            if (!parent || !parent.closest('article')) tweets.push(matches[k]);
         }
         
         for (var i = 0; i < Math.min(tweets.length, 15); i++) {
@@ -76,7 +114,7 @@ class TwitterEngagement:
             var userLinks = tweet.querySelectorAll('a[href^="/"]');
             for (var j = 0; j < userLinks.length; j++) {
                 var href = userLinks[j].getAttribute('href') || '';
-                if (href.match(/^\\/[a-zA-Z0-9_]+$/) && !href.includes('/status/')) {
+                if (RE_USER.test(href) && !href.includes('/status/')) {
                     username = href.replace('/', '');
                     break;
                 }
@@ -84,15 +122,15 @@ class TwitterEngagement:
             
             // Fallback: extract from any @username text
             if (!username) {
-                var allText = tweet.innerText;
-                var atMatch = allText.match(/@([a-zA-Z0-9_]{1,15})/);
+                var allText = tweet.textContent;
+                var atMatch = allText.match(RE_AT);
                 if (atMatch) username = atMatch[1];
             }
             
             // Get tweet text
             var tweetText = tweet.querySelector('[data-testid="tweetText"]');
             if (!tweetText) tweetText = tweet.querySelector('[lang]');
-            var content = tweetText ? tweetText.innerText : '';
+            var content = tweetText ? tweetText.textContent.trim() : '';
             
             // Get tweet link
             var timeLink = tweet.querySelector('a[href*="/status/"]');
@@ -100,40 +138,34 @@ class TwitterEngagement:
             
             // Skip if no content or too short (allow shorter tweets)
             if (username && content.length > 10 && tweetUrl) {
-                return JSON.stringify({
+                // Click the tweet to open it
+                var clicked = 'clicked';
+                if (tweetText) {
+                    tweetText.click();
+                } else {
+                    tweet.click();
+                    clicked = 'clicked_article';
+                }
+                return '__OK__' + JSON.stringify({
                     username: username,
                     url: tweetUrl,
                     content: content.substring(0, 300),
-                    index: i
+                    index: i,
+                    clicked: clicked
                 });
             }
         }
-        return JSON.stringify({error: 'No suitable tweet found', debug: 'Found ' + tweets.length + ' articles'});
+        return '__OK__' + JSON.stringify({error: 'No suitable tweet found', debug: 'Found ' + tweets.length + ' articles'});
     })()
     '''
     
-    # JavaScript to click into a tweet
-    JS_CLICK_TWEET = '''
-    (function() {
-        var tweets = document.querySelectorAll('article[data-testid="tweet"]');
-        var targetIndex = {index};
-        if (tweets[targetIndex]) {
-            // Click the tweet to open it
-            var tweetText = tweets[targetIndex].querySelector('[data-testid="tweetText"]');
-            if (tweetText) {
-                tweetText.click();
-                return 'clicked';
-            }
-            tweets[targetIndex].click();
-            return 'clicked_article';
-        }
-        return 'not_found';
-    })()
-    '''
-    
-    # JavaScript to extract tweet and replies
+    # JavaScript to extract tweet and replies; returns '' if the
+    # detail view hasn't rendered
     JS_EXTRACT_TWEET_DATA = '''
     (function() {
+        if (location.pathname.indexOf('/status/') < 0) return '';
+        if (!document.querySelector('article[data-testid="tweet"] [data-testid="tweetText"]')) return '';
+        
         var data = {
             mainTweet: '',
             username: '',
@@ -157,35 +189,43 @@ class TwitterEngagement:
             
             // Get tweet text
             var tweetText = mainArticle.querySelector('[data-testid="tweetText"]');
-            data.mainTweet = tweetText ? tweetText.innerText : '';
+            data.mainTweet = tweetText ? tweetText.textContent.trim() : '';
             
             // Get engagement stats
             var statsGroup = mainArticle.querySelector('[role="group"]');
             if (statsGroup) {
-                data.engagement = statsGroup.innerText.replace(/\\n/g, ' ');
+                // aria-label is the readable summary ('12 replies, 34 likes, ...');
+                // textContent would run the counts together
+                data.engagement = (statsGroup.getAttribute('aria-label') || statsGroup.textContent).replace(/\\n/g, ' ').trim();
             }
         }
         
-        // Get replies (subsequent articles)
-        for (var i = 1; i < Math.min(articles.length, 10); i++) {
+        // Get replies (subsequent articles), stopping once 9 are collected;
+        // articles without text or author don't count towards the cap
+        var added = 0;
+        for (var i = 1; i < articles.length; i++) {
+            if (added >= 9) break;
             var reply = articles[i];
             var replyText = reply.querySelector('[data-testid="tweetText"]');
+            if (!replyText) continue;
             var replyUser = reply.querySelector('a[href^="/"][role="link"]');
+            if (!replyUser) continue;
             
-            if (replyText && replyUser) {
-                var username = replyUser.getAttribute('href').replace('/', '');
-                data.replies.push('@' + username + ': ' + replyText.innerText.substring(0, 150));
-            }
+            var username = replyUser.getAttribute('href').replace('/', '');
+            data.replies.push('@' + username + ': ' + replyText.textContent.trim().substring(0, 150));
+            added++;
         }
         
-        return JSON.stringify(data);
+        return '__OK__' + JSON.stringify(data);
     })()
     '''
     
     # JavaScript to like the tweet
     JS_LIKE_TWEET = '''
     (function() {
-        var likeButton = document.querySelector('[data-testid="like"]');
+        // Scope to the main tweet so the lookup only walks its subtree
+        var main = document.querySelector('article[data-testid="tweet"]') || document;
+        var likeButton = main.querySelector('[data-testid="like"]');
         if (likeButton) {
             likeButton.click();
             return 'liked';
@@ -197,7 +237,8 @@ class TwitterEngagement:
     # JavaScript to click reply button
     JS_CLICK_REPLY = '''
     (function() {
-        var replyButton = document.querySelector('[data-testid="reply"]');
+        var main = document.querySelector('article[data-testid="tweet"]') || document;
+        var replyButton = main.querySelector('[data-testid="reply"]');
         if (replyButton) {
             replyButton.click();
             return 'clicked';
@@ -210,7 +251,7 @@ class TwitterEngagement:
     JS_FOCUS_INPUT = '''
     (function() {
         // Strategy 1: Find contenteditable in #layers modal
-        var layers = document.querySelector('#layers');
+        var layers = document.getElementById('layers');
         if (layers) {
             var editable = layers.querySelector('[contenteditable="true"]');
             if (editable && editable.offsetParent !== null) {
@@ -248,10 +289,10 @@ class TwitterEngagement:
     JS_SUBMIT = '''
     (function() {
         // Strategy 1: Find Reply button in modal layers (user-provided selector)
-        var layersBtn = document.querySelector('#layers button');
-        if (layersBtn) {
+        var layers = document.getElementById('layers');
+        if (layers) {
             // Find the actual Reply button in the modal
-            var btns = document.querySelectorAll('#layers button');
+            var btns = layers.getElementsByTagName('button');
             for (var i = 0; i < btns.length; i++) {
                 var btn = btns[i];
                 var text = (btn.innerText || '').trim();
@@ -276,8 +317,9 @@ class TwitterEngagement:
             return 'submitted_inline';
         }
         
-        // Strategy 4: Find button with exact "Reply" text anywhere
-        var buttons = document.querySelectorAll('button');
+        // Strategy 4: Find button with exact "Reply" text in the main column
+        var scope = document.querySelector('main') || document;
+        var buttons = scope.getElementsByTagName('button');
         for (var i = 0; i < buttons.length; i++) {
             var btn = buttons[i];
             var text = (btn.innerText || '').trim();
@@ -304,6 +346,14 @@ class TwitterEngagement:
         self.safari = SafariController()
         self.ai = AICommentGenerator(api_key=openai_api_key)
     
+    def _wait_focused(self, timeout: float = 2.0) -> bool:
+        """Wait until the reply input holds focus."""
+        return self.safari.wait_for_js(self.JS_INPUT_FOCUSED, timeout=timeout) is not None
+    
+    def _wait_submittable(self, timeout: float = 3.0) -> bool:
+        """Wait until the reply button is enabled (typed text registered)."""
+        return self.safari.wait_for_js(self.JS_SUBMITTABLE, timeout=timeout) is not None
+    
     def engage_with_post(self) -> TwitterEngagementResult:
         """
         Run the full Twitter engagement flow.
@@ -311,18 +361,25 @@ class TwitterEngagement:
         Returns:
             TwitterEngagementResult with details of engagement
         """
+        try:
+            return self._engage_with_post()
+        finally:
+            # Stop the controller's resident osascript worker
+            self.safari.close()
+    
+    def _engage_with_post(self) -> TwitterEngagementResult:
         timestamp = int(time.time())
         result = TwitterEngagementResult(success=False)
         
         # Step 1: Navigate to Twitter
         print("\n[1/8] Navigating to Twitter...")
-        if not self.safari.navigate_to(self.TWITTER_URL):
+        nav = self.safari.navigate_to(self.TWITTER_URL, wait_time=0)
+        if not nav.success:
             result.error = "Failed to navigate to Twitter"
             return result
-        time.sleep(4)
         
-        # Verify we're on Twitter
-        current_url = self.safari.get_current_url()
+        # Verify we're on Twitter (the feed probe reports location.href)
+        current_url = self.safari.wait_for_js(self.JS_FEED_READY, timeout=10) or self.safari.get_current_url()
         if 'x.com' not in current_url and 'twitter.com' not in current_url:
             result.error = f"Not on Twitter: {current_url}"
             return result
@@ -331,10 +388,7 @@ class TwitterEngagement:
         # Step 2: Find a tweet
         print("\n[2/8] Finding tweet in feed...")
         tweet_data = self.safari.execute_js(self.JS_FIND_TWEET)
-        try:
-            tweet_info = json.loads(tweet_data) if tweet_data else {}
-        except:
-            tweet_info = {}
+        tweet_info = _parse(tweet_data)
         
         if 'error' in tweet_info or not tweet_info.get('username'):
             result.error = "Could not find suitable tweet"
@@ -342,24 +396,19 @@ class TwitterEngagement:
         
         result.username = f"@{tweet_info.get('username', '')}"
         result.post_url = tweet_info.get('url', '')
-        tweet_index = tweet_info.get('index', 0)
         print(f"   ✅ Found: {result.username}")
         print(f"   Content: {tweet_info.get('content', '')[:60]}...")
         
-        # Step 3: Click into the tweet
+        # Step 3: Click into the tweet (clicked by JS_FIND_TWEET)
         print("\n[3/8] Opening tweet...")
-        click_js = self.JS_CLICK_TWEET.replace('{index}', str(tweet_index))
-        click_result = self.safari.execute_js(click_js)
-        print(f"   {click_result}")
-        time.sleep(3)
+        print(f"   {tweet_info.get('clicked', 'not_found')}")
         
-        # Step 4: Extract tweet and replies
+        # Step 4: Extract tweet and replies once replies render (tweets
+        # without replies never pass the probe - extract anyway)
         print("\n[4/8] Extracting tweet and replies...")
+        self.safari.wait_for_js(self.JS_REPLIES_READY, timeout=6)
         extract_data = self.safari.execute_js(self.JS_EXTRACT_TWEET_DATA)
-        try:
-            tweet_detail = json.loads(extract_data) if extract_data else {}
-        except:
-            tweet_detail = {}
+        tweet_detail = _parse(extract_data)
         
         result.post_content = tweet_detail.get('mainTweet', '')[:500]
         result.replies = tweet_detail.get('replies', [])
@@ -372,15 +421,8 @@ class TwitterEngagement:
             for reply in result.replies[:3]:
                 print(f"      - {reply[:50]}...")
         
-        # Step 5: Like the tweet
-        print("\n[5/8] Liking tweet...")
-        like_result = self.safari.execute_js(self.JS_LIKE_TWEET)
-        result.liked = like_result == 'liked'
-        print(f"   {like_result}")
-        time.sleep(1)
-        
-        # Step 6: Generate AI comment
-        print("\n[6/8] Generating AI comment...")
+        # Step 5: Generate AI comment
+        print("\n[5/8] Generating AI comment...")
         comment_result = self.ai.generate_comment(
             platform="twitter",
             post_content=result.post_content,
@@ -395,35 +437,43 @@ class TwitterEngagement:
         result.generated_comment = comment_result.text
         print(f"   ✅ Generated: \"{result.generated_comment}\"")
         
+        # Step 6: Like the tweet and open the reply composer in one
+        # osascript process
+        print("\n[6/8] Liking tweet and opening reply...")
+        like_result, reply_click = self.safari.execute_js_batch(
+            [self.JS_LIKE_TWEET, self.JS_CLICK_REPLY]
+        ) or ('not_found', 'not_found')
+        result.liked = like_result == 'liked'
+        print(f"   {like_result}")
+        print(f"   Reply button: {reply_click}")
+        self.safari.wait_for_js(self.JS_COMPOSER_OPEN, timeout=4)
+        
         # Step 7: Post reply
         print("\n[7/8] Posting reply...")
         
-        # Click reply button to open composer
-        reply_click = self.safari.execute_js(self.JS_CLICK_REPLY)
-        print(f"   Reply button: {reply_click}")
-        time.sleep(2)
-        
         # Focus input
         focus_result = self.safari.execute_js(self.JS_FOCUS_INPUT)
-        if 'focused' not in focus_result:
+        if 'focused' not in (focus_result or ''):
             result.error = "Could not focus reply input"
             return result
         print(f"   Focus: {focus_result}")
-        time.sleep(0.5)
+        self._wait_focused()
         
         # Type comment
         self.safari.type_via_clipboard(result.generated_comment)
         print(f"   ✅ Typed")
-        time.sleep(1)
+        self._wait_submittable()
         
         # Submit
-        submit_result = self.safari.execute_js(self.JS_SUBMIT)
+        submit_result = self.safari.execute_js(self.JS_SUBMIT) or ''
         result.comment_posted = 'clicked' in submit_result or 'submitted' in submit_result
         print(f"   Submit: {submit_result}")
-        time.sleep(8)  # Wait for reply to post
         
-        # Step 8: Capture proof
+        # Step 8: Capture proof once the reply has posted
         print("\n[8/8] Capturing proof...")
+        if result.comment_posted:
+            # Wait for reply to post (composer closes)
+            self.safari.wait_for_js(self.JS_COMPOSER_CLOSED, timeout=8)
         result.proof_screenshot = f"/tmp/twitter_proof_{timestamp}.png"
         self.safari.take_screenshot(result.proof_screenshot)
         print(f"   📸 {result.proof_screenshot}")
@@ -5,22 +5,119 @@ Ad Intelligence Pipeline — Market Research → Ad Creation
 Analyzes top-ranked scraped posts to extract winning patterns,
 then generates ad briefs and Sora video prompts for our products/offers.
 """
+import hashlib
 import json
 import re
 import os
+import sys
+import tempfile
+import uuid
 from pathlib import Path
-from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from types import MappingProxyType
+from datetime import date, datetime
+from typing import Callable, List, Dict, Optional, Tuple
 from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
 from loguru import logger
 
-from market_research.storage import ResearchStorage
+# orjson is optional - faster parse/serialize of research and brief JSON
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# ijson is optional - streams just the first top_n items of large
+# ranked.json / ads.json dumps instead of decoding the whole file
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# pyahocorasick is optional - matches every competitor brand word against
+# a hook in one pass instead of one substring scan per word
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
 
 RESEARCH_BASE = os.path.expanduser("~/market-research")
 
+# Disk cache of PatternAnalyzer.analyze results, keyed by a hash of the
+# analyzed posts; bump the version whenever analyze() output changes
+PATTERNS_CACHE_DIR = Path(RESEARCH_BASE) / ".cache" / "patterns"
+PATTERNS_CACHE_VERSION = 1
+
+BRIEFS_DIR = Path(RESEARCH_BASE) / "ad-briefs"
+
+# One-line summary per saved brief, appended next to the briefs so the
+# `briefs` listing doesn't have to parse every brief document
+BRIEFS_INDEX_FILE = "_index.jsonl"
+
+# ── Precompiled patterns (shared by PatternAnalyzer / AdBriefGenerator) ──
+
+_HOOK_NUMBER_RE = re.compile(r"\d+%|\d+x|\$\d+")
+_STAT_RE = re.compile(
+    r"(\d+[\d,.]*\s*(?:%|x|hours?|minutes?|days?|months?|years?|people|million|billion|\$[\d,]+))",
+    re.I,
+)
+# Everything that disqualifies a competitor hook in _adapt_hook, matched
+# against the lower-cased hook in one pass: video-player/login junk,
+# URLs and @handles, hashtags, and bare domains
+_ADAPT_REJECT_RE = re.compile(
+    "|".join(re.escape(p) for p in (
+        "sorry, we're having trouble", "0:00 /", "log in", "to see this content",
+        "confirm your age", "sponsored", "library id", "http", "www.", "@", "#",
+    ))
+    + r"|\b\w+\.(?:com|io|co|net|org|app|ai)\b"
+)
+_HASHTAG_RE = re.compile(r"#[\w\u00C0-\u024F]+")
+# Presence check only: flags, symbols & pictographs + emoticons (adjacent
+# blocks merged), transport & map. No quantifier - the first hit is enough.
+_EMOJI_RE = re.compile(
+    "[\U0001F1E0-\U0001F1FF\U0001F300-\U0001F64F\U0001F680-\U0001F6FF]",
+    flags=re.UNICODE,
+)
+_CONTRAST_RE = re.compile(r"stop |don't |never ")
+_CURIOSITY_RE = re.compile(r"how to|the secret|the truth")
+_CAP_WORD_RE = re.compile(r"\b[A-Z][a-z]{2,}\b")
+_AUTHOR_SPLIT_RE = re.compile(r"[\s\-_/&]+")
+_SENTENCE_SPLIT_RE = re.compile(r"[.!?\n]")
+
+# Keyword → directory/file slug in a single translate pass
+_SLUG_TABLE = str.maketrans({" ": "-", "/": "-"})
+
+# Words too generic to treat as competitor brand names in _generate_hooks
+_COMMON_WORDS = frozenset({
+    "the", "this", "that", "when", "what", "with", "from", "your", "here",
+    "stop", "just", "have", "been", "they", "will", "more", "most", "some",
+    "into", "over", "after", "every", "still", "even", "only", "also", "then",
+    "than", "their", "there", "these", "those", "about", "which", "while",
+    "business", "people", "time", "work", "free", "best", "rest", "learn",
+    "digital", "marketing", "online", "program", "week", "weeks", "month",
+})
+
+_STORY_PREFIXES = ("i ", "we ", "my ")
+_QUESTION_PREFIXES = ("why", "what if", "how", "are you", "do you", "have you")
+
+_CTA_PATTERNS = (
+    "link in bio", "comment below", "dm me", "click the link",
+    "save this", "share this", "follow for more", "tag a friend",
+    "drop a", "let me know", "sign up", "get started",
+)
+# One scan for every CTA phrase; the lookahead reports overlapping hits
+# too (e.g. "link in bio" inside "click the link in bio")
+_CTA_RE = re.compile("(?=(%s))" % "|".join(re.escape(c) for c in _CTA_PATTERNS))
+
 # ── Our Products & Offers ──
 
-PRODUCTS = {
+PRODUCTS = MappingProxyType({
     "everreach-app-kit": {
         "name": "EverReach App Kit",
         "tagline": "Launch your mobile app in days, not months",
@@ -163,11 +260,14 @@ PRODUCTS = {
             "Validate ideas before you build",
         ],
     },
-}
+})
+
+# CLI choices for --product, built once from the frozen PRODUCTS
+_PRODUCT_KEYS = tuple(PRODUCTS)
 
 # ── Hook Templates (derived from top-performing content patterns) ──
 
-HOOK_TEMPLATES = {
+HOOK_TEMPLATES = MappingProxyType({
     "question": "Are you still {pain_point}?",
     "bold_claim": "I {result} in {timeframe} without {objection}.",
     "stat": "{stat}% of {audience} struggle with {pain_point}.",
@@ -176,161 +276,323 @@ HOOK_TEMPLATES = {
     "curiosity": "The {adjective} way to {desired_outcome} (most people don't know this).",
     "social_proof": "{number} {audience} already use this to {desired_outcome}.",
     "urgency": "If you're not {doing_thing} yet, you're leaving money on the table.",
-}
+})
+
+# Markdown brief skeleton - only the brief-specific fields are filled in;
+# the numbered hooks go between the two parts, inspiration URLs after.
+_MD_BRIEF_HEAD = (
+    "# Ad Brief: {product} × \"{keyword}\"\n"
+    "**Generated:** {date}  \n"
+    "**Format:** {format} | **Platform:** {platform}\n"
+    "\n"
+    "---\n"
+    "\n"
+    "## Hooks (pick one)\n"
+)
+_MD_BRIEF_BODY = (
+    "\n"
+    "## Suggested Caption\n"
+    "\n"
+    "```\n"
+    "{caption}\n"
+    "```\n"
+    "\n"
+    "## Sora Video Prompt\n"
+    "\n"
+    "```\n"
+    "{sora_prompt}\n"
+    "```\n"
+    "\n"
+    "## Hashtags\n"
+    "\n"
+    "{hashtags}\n"
+    "\n"
+    "## Competitor Insights\n"
+    "\n"
+    "{insights}\n"
+    "\n"
+    "## Inspiration Posts\n"
+)
+
+# Sora prompt for the brief; %(hook).80s truncates the hook to 80 chars
+_SORA_PROMPT_TMPL = (
+    "@isaiahdupree standing confidently in a modern, well-lit studio space, "
+    "speaking directly to camera with energy and authenticity. "
+    "He's wearing his signature casual hoodie and gold chain. "
+    "The background shows a clean workspace with subtle tech elements. "
+    "He opens with: \"%(hook).80s\" — gesturing naturally as he speaks. "
+    "The camera starts with a close-up on his face, then pulls back to reveal "
+    "a screen behind him showing %(product_name)s. "
+    "Warm, natural lighting. Vertical %(aspect)s format. "
+    "Cinematic but authentic, like a high-quality social media video."
+)
+
+# Console summary printed per pipeline brief, written in one call
+_BRIEF_SUMMARY_TMPL = (
+    "\n{rule}\n"
+    "💡 AD BRIEF: {product} × '{keyword}'\n"
+    "{rule}\n"
+    "  Format:  {format}\n"
+    "  Hook:    {hook:.80}\n"
+    "  CTA:     {cta}\n"
+    "  Hashtags: {hashtags}\n"
+    "  Insights: {insights:.100}...\n"
+    "\n"
+)
+
+
+def _brand_matcher(words: set) -> Callable[[str], bool]:
+    """Build a predicate telling whether text contains any of words."""
+    if not words:
+        return lambda text: False
+    if HAS_AHOCORASICK:
+        automaton = ahocorasick.Automaton()
+        for w in words:
+            automaton.add_word(w, w)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    return lambda text: any(w in text for w in words)
+
+
+@lru_cache(maxsize=128)
+def _load_json_head(path: str, mtime_ns: int, top_n: int) -> Tuple[dict, ...]:
+    """
+    Parse a ranked.json / ads.json list and keep its first top_n items.
+
+    Cached per (path, mtime_ns, top_n), so repeated briefs for the same
+    keyword in one process skip the re-read; a rewritten file has a new
+    mtime and misses the cache. Callers must treat the items as read-only.
+    """
+    if HAS_IJSON:
+        with open(path, "rb") as f:
+            return tuple(islice(ijson.items(f, "item", use_float=True), top_n))
+    return tuple(_json_loads(Path(path).read_bytes())[:top_n])
+
+
+def _json_bytes(data, indent: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, pretty-printed when indent is set."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None).encode()
+
+
+@dataclass
+class PostFeatures:
+    """Fields PatternAnalyzer needs from one post, extracted once."""
+    hook: str
+    hook_lower: str
+    text: str
+    text_lower: str
+    reactions: int
+    comments: int
+    shares: int
+    views: int
+    content_type: str
+    overall_rank: float
+    hashtags: List[str] = field(default_factory=list)
+    cta_text: str = ""
 
 
 class PatternAnalyzer:
     """Analyzes scraped posts to extract winning content patterns."""
 
+    # Only the top-ranked posts are analyzed, however many are passed in
+    ANALYZE_WINDOW = 20
+
     def analyze(self, posts: List[dict], keyword: str) -> dict:
         """Extract patterns from top-ranked posts."""
         if not posts:
             return {}
 
-        top = posts[:20]  # Analyze top 20
+        top = posts[:self.ANALYZE_WINDOW]
+        n = len(top)
+
+        # Single pass: extract each post's features once and fold them
+        # into every aggregate
+        features: List[PostFeatures] = []
+        hooks: List[str] = []
+        hook_lengths: List[int] = []
+        caption_lengths: List[int] = []
+        hook_formats: Counter = Counter()
+        hashtag_hits: List[str] = []
+        cta_hits: List[str] = []
+        type_totals: Dict[str, List[float]] = {}  # content_type -> [rank_sum, count]
+        with_emoji = 0
+        reactions_sum = comments_sum = shares_sum = views_sum = 0
+
+        for p in top:
+            f = self._post_features(p)
+            features.append(f)
+
+            if f.hook:
+                if len(f.hook) > 10:
+                    hooks.append(f.hook)
+                hook_lengths.append(len(f.hook.split()))
+                hook_formats[self._classify_hook(f.hook_lower)] += 1
+            if f.text:
+                caption_lengths.append(len(f.text.split()))
+                if _EMOJI_RE.search(f.text) is not None:
+                    with_emoji += 1
+
+            self._collect_hashtags(hashtag_hits, f)
+            self._collect_ctas(cta_hits, f)
+            totals = type_totals.get(f.content_type)
+            if totals is None:
+                type_totals[f.content_type] = [f.overall_rank, 1]
+            else:
+                totals[0] += f.overall_rank
+                totals[1] += 1
+
+            reactions_sum += f.reactions
+            comments_sum += f.comments
+            shares_sum += f.shares
+            views_sum += f.views
+
+        # One C-level histogram pass each instead of per-item Counter bumps
+        all_tags = Counter(hashtag_hits)
+        found_ctas = Counter(cta_hits)
 
         patterns = {
             "keyword": keyword,
             "analyzed_at": datetime.now().isoformat(),
-            "post_count": len(top),
+            "post_count": n,
 
             # Hook patterns
-            "top_hooks": self._extract_hooks(top),
-            "hook_formats": self._classify_hooks(top),
-            "avg_hook_length": self._avg_hook_length(top),
+            "top_hooks": hooks[:10],
+            "hook_formats": hook_formats,
+            "avg_hook_length": sum(hook_lengths) / max(len(hook_lengths), 1),
 
             # Caption patterns
-            "avg_caption_length": self._avg_caption_length(top),
-            "top_hashtags": self._top_hashtags(top),
-            "cta_patterns": self._extract_ctas(top),
-            "emoji_usage_rate": self._emoji_rate(top),
+            "avg_caption_length": sum(caption_lengths) / max(len(caption_lengths), 1),
+            "top_hashtags": [tag for tag, _ in all_tags.most_common(15)],
+            "cta_patterns": [cta for cta, _ in found_ctas.most_common(5)],
+            "emoji_usage_rate": with_emoji / n,
 
             # Engagement patterns
-            "best_content_types": self._content_type_ranking(top),
-            "avg_reactions": int(sum(p.get("reactions", p.get("likes", 0)) for p in top) / max(len(top), 1)),
-            "avg_comments": int(sum(p.get("comments", 0) for p in top) / max(len(top), 1)),
-            "avg_shares": int(sum(p.get("shares", 0) for p in top) / max(len(top), 1)),
-            "avg_views": int(sum(p.get("views", 0) or 0 for p in top) / max(len(top), 1)),
+            "best_content_types": self._content_type_ranking(type_totals),
+            "avg_reactions": int(reactions_sum / n),
+            "avg_comments": int(comments_sum / n),
+            "avg_shares": int(shares_sum / n),
+            "avg_views": int(views_sum / n),
 
             # Top performing posts (reference)
             "top_posts": [
                 {
                     "url": p.get("url", ""),
                     "author": p.get("author_name", p.get("author_username", "")),
-                    "reactions": p.get("reactions", p.get("likes", 0)),
+                    "reactions": f.reactions,
                     "content_type": p.get("content_type", ""),
-                    "hook": self._get_hook(p),
-                    "overall_rank": p.get("overall_rank", 0),
+                    "hook": f.hook,
+                    "overall_rank": f.overall_rank,
                 }
-                for p in top[:5]
+                for p, f in zip(top[:5], features)
             ],
         }
 
         return patterns
 
-    def _get_hook(self, post: dict) -> str:
-        """Extract first line of post text as the hook."""
+    def _post_features(self, post: dict) -> PostFeatures:
+        """Read every field the aggregates use from a post dict."""
         text = post.get("text_content", post.get("caption", "")) or ""
-        lines = [l.strip() for l in text.split("\n") if l.strip()]
-        return lines[0][:120] if lines else ""
-
-    def _extract_hooks(self, posts: List[dict]) -> List[str]:
-        hooks = []
-        for p in posts:
-            h = self._get_hook(p)
-            if h and len(h) > 10:
-                hooks.append(h)
-        return hooks[:10]
-
-    def _classify_hooks(self, posts: List[dict]) -> Dict[str, int]:
-        formats: Dict[str, int] = Counter()
-        for p in posts:
-            h = self._get_hook(p).lower()
-            if not h:
-                continue
-            if h.endswith("?"):
-                formats["question"] += 1
-            elif any(h.startswith(w) for w in ["i ", "we ", "my "]):
-                formats["personal_story"] += 1
-            elif re.search(r"\d+%|\d+x|\$\d+", h):
-                formats["stat_or_number"] += 1
-            elif any(w in h for w in ["stop ", "don't ", "never "]):
-                formats["contrast"] += 1
-            elif any(w in h for w in ["how to", "the secret", "the truth"]):
-                formats["curiosity"] += 1
-            else:
-                formats["statement"] += 1
-        return dict(formats)
-
-    def _avg_hook_length(self, posts: List[dict]) -> float:
-        hooks = [self._get_hook(p) for p in posts]
-        lengths = [len(h.split()) for h in hooks if h]
-        return sum(lengths) / max(len(lengths), 1)
-
-    def _avg_caption_length(self, posts: List[dict]) -> float:
-        texts = [post.get("text_content", post.get("caption", "")) or "" for post in posts]
-        lengths = [len(t.split()) for t in texts if t]
-        return sum(lengths) / max(len(lengths), 1)
-
-    def _top_hashtags(self, posts: List[dict]) -> List[str]:
-        all_tags: Counter = Counter()
-        for p in posts:
-            # Use hashtags list if available
-            for tag in (p.get("hashtags") or []):
-                all_tags[tag.lower()] += 1
-            # Also extract from text_content (Ad Library ads embed hashtags in body)
-            text = p.get("text_content", p.get("caption", "")) or ""
-            for tag in re.findall(r"#[\w\u00C0-\u024F]+", text):
-                all_tags[tag.lower()] += 1
-        return [tag for tag, _ in all_tags.most_common(15)]
-
-    def _extract_ctas(self, posts: List[dict]) -> List[str]:
-        cta_patterns = [
-            "link in bio", "comment below", "dm me", "click the link",
-            "save this", "share this", "follow for more", "tag a friend",
-            "drop a", "let me know", "sign up", "get started",
-        ]
-        found: Counter = Counter()
-        for p in posts:
-            # Check cta_text field (from Ad Library)
-            cta_field = (p.get("cta_text") or "").strip()
-            if cta_field:
-                found[cta_field] += 1
-            # Also scan body text
-            text = (p.get("text_content", p.get("caption", "")) or "").lower()
-            for cta in cta_patterns:
-                if cta in text:
-                    found[cta] += 1
-        return [cta for cta, _ in found.most_common(5)]
-
-    def _emoji_rate(self, posts: List[dict]) -> float:
-        emoji_pattern = re.compile(
-            "[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF"
-            "\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF]+",
-            flags=re.UNICODE,
+        hook = self._hook_from_text(text)
+        return PostFeatures(
+            hook=hook,
+            hook_lower=hook.lower(),
+            text=text,
+            text_lower=text.lower(),
+            reactions=post.get("reactions", post.get("likes", 0)),
+            comments=post.get("comments", 0),
+            shares=post.get("shares", 0),
+            views=post.get("views", 0) or 0,
+            content_type=post.get("content_type", "unknown"),
+            overall_rank=post.get("overall_rank", 0),
+            hashtags=post.get("hashtags") or [],
+            cta_text=(post.get("cta_text") or "").strip(),
         )
-        with_emoji = sum(
-            1 for p in posts
-            if emoji_pattern.search(p.get("text_content", p.get("caption", "")) or "")
-        )
-        return with_emoji / max(len(posts), 1)
-
-    def _content_type_ranking(self, posts: List[dict]) -> List[str]:
-        type_scores: Dict[str, List[float]] = {}
-        for p in posts:
-            ct = p.get("content_type", "unknown")
-            score = p.get("overall_rank", 0)
-            type_scores.setdefault(ct, []).append(score)
-        avg_by_type = {ct: sum(scores) / len(scores) for ct, scores in type_scores.items()}
+
+    @staticmethod
+    def _hook_from_text(text: str) -> str:
+        """Extract first line of post text as the hook."""
+        # Scan line by line and stop at the first non-blank one, rather
+        # than splitting the whole (possibly long) ad copy into a list
+        start = 0
+        while True:
+            end = text.find("\n", start)
+            line = (text[start:end] if end >= 0 else text[start:]).strip()
+            if line:
+                return line[:120]
+            if end < 0:
+                return ""
+            start = end + 1
+
+    @staticmethod
+    def _classify_hook(h: str) -> str:
+        """Classify a lower-cased, non-empty hook into a hook format."""
+        if h.endswith("?"):
+            return "question"
+        elif h.startswith(_STORY_PREFIXES):
+            return "personal_story"
+        elif _HOOK_NUMBER_RE.search(h):
+            return "stat_or_number"
+        elif _CONTRAST_RE.search(h):
+            return "contrast"
+        elif _CURIOSITY_RE.search(h):
+            return "curiosity"
+        return "statement"
+
+    @staticmethod
+    def _collect_hashtags(hits: List[str], f: PostFeatures):
+        # Use hashtags list if available
+        hits.extend([tag.lower() for tag in f.hashtags])
+        # Also extract from text_content (Ad Library ads embed hashtags in body)
+        hits.extend([tag.lower() for tag in _HASHTAG_RE.findall(f.text)])
+
+    @staticmethod
+    def _collect_ctas(hits: List[str], f: PostFeatures):
+        # Check cta_text field (from Ad Library)
+        if f.cta_text:
+            hits.append(f.cta_text)
+        # Also scan body text
+        matched = set(_CTA_RE.findall(f.text_lower))
+        if matched:
+            # Count each phrase once per post, in _CTA_PATTERNS order
+            hits.extend([cta for cta in _CTA_PATTERNS if cta in matched])
+
+    @staticmethod
+    def _content_type_ranking(type_totals: Dict[str, List[float]]) -> List[str]:
+        avg_by_type = {ct: total / count for ct, (total, count) in type_totals.items()}
         return [ct for ct, _ in sorted(avg_by_type.items(), key=lambda x: x[1], reverse=True)]
 
 
+@lru_cache(maxsize=1)
+def _shared_storage():
+    """
+    Process-wide ResearchStorage, so creating many generators doesn't
+    repeat its directory and schema setup. Safe to share across threads:
+    every ResearchStorage method opens its own SQLite connection.
+
+    Imported here so the `products` / `briefs` CLI commands don't load
+    the storage layer (sqlite3, models) at startup.
+    """
+    from market_research.storage import ResearchStorage
+    return ResearchStorage()
+
+
+# PatternAnalyzer holds no state, so one instance serves every generator
+_ANALYZER = PatternAnalyzer()
+
+
 class AdBriefGenerator:
     """Generates ad briefs and Sora prompts from research patterns."""
 
-    def __init__(self):
-        self.storage = ResearchStorage()
-        self.analyzer = PatternAnalyzer()
+    def __init__(self, write_md: bool = True):
+        self.storage = _shared_storage()
+        self.analyzer = _ANALYZER
+        self.write_md = write_md
+        # Date stamped on saved brief filenames; ResearchPipeline pins it
+        # once per run, otherwise each save uses today's date
+        self.run_date: Optional[str] = None
+        self._briefs_dir_ready = False
 
     def generate(
         self,
@@ -351,37 +613,130 @@ class AdBriefGenerator:
         Returns:
             Ad brief dict with hooks, captions, Sora prompt, etc.
         """
-        product = PRODUCTS.get(product_key)
-        if not product:
-            logger.error(f"Unknown product: {product_key}. Available: {list(PRODUCTS.keys())}")
+        if not self._get_product(product_key):
             return {}
 
         # Load top posts
         posts = self._load_posts(keyword, platform, top_n)
+        return self._generate_from_posts(keyword, product_key, platform, posts)
+
+    def generate_batch(
+        self,
+        jobs: List[Tuple[str, str, str]],
+        top_n: int = 20,
+        max_workers: int = 8,
+        save: bool = True,
+    ) -> List[dict]:
+        """
+        Generate ad briefs for many (keyword, product_key, platform) jobs.
+
+        Posts for each distinct (keyword, platform) are loaded once, in a
+        thread pool (the loads are file/SQLite I/O); analysis and brief
+        building then run on the calling thread, so briefs are saved in
+        job order.
+
+        Args:
+            jobs: (keyword, product_key, platform) triples
+            top_n: How many top posts to analyze
+            max_workers: Threads used to load posts
+            save: Save each brief to its own file (off when the caller
+                bundles the briefs itself)
+
+        Returns:
+            One brief per job, in job order ({} where generation failed)
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        sources = list(dict.fromkeys((keyword, platform) for keyword, _, platform in jobs))
+        if not sources:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(sources))) as pool:
+            loaded = pool.map(lambda src: self._load_posts(src[0], src[1], top_n), sources)
+            posts_by_source = dict(zip(sources, loaded))
+
+        return [
+            self._generate_from_posts(keyword, product_key, platform, posts_by_source[keyword, platform], save)
+            for keyword, product_key, platform in jobs
+        ]
+
+    def _get_product(self, product_key: str) -> Optional[dict]:
+        product = PRODUCTS.get(product_key)
+        if not product:
+            logger.error(f"Unknown product: {product_key}. Available: {list(_PRODUCT_KEYS)}")
+        return product
+
+    def _generate_from_posts(
+        self,
+        keyword: str,
+        product_key: str,
+        platform: str,
+        posts: List[dict],
+        save: bool = True,
+    ) -> dict:
+        """Analyze loaded posts, then build (and optionally save) the brief."""
+        product = self._get_product(product_key)
+        if not product:
+            return {}
+
         if not posts:
             logger.warning(f"No posts found for '{keyword}' on {platform}. Run a search first.")
             return {}
 
-        # Analyze patterns
-        patterns = self.analyzer.analyze(posts, keyword)
+        # Analyze patterns (cached on disk per keyword/platform/posts)
+        patterns = self._analyze_cached(posts, keyword, platform)
 
         # Generate brief
-        brief = self._build_brief(keyword, product, patterns, posts)
+        brief = self._build_brief(keyword, product_key, product, patterns, posts)
 
         # Save
-        self._save_brief(brief, keyword, product_key)
+        if save:
+            self._save_brief(brief, keyword, product_key)
 
         return brief
 
+    def _analyze_cached(self, posts: List[dict], keyword: str, platform: str) -> dict:
+        """
+        Run PatternAnalyzer.analyze, reusing the on-disk result for
+        identical input so briefs for other products skip the analysis.
+        Each call returns its own freshly parsed dict.
+        """
+        window = posts[:PatternAnalyzer.ANALYZE_WINDOW]
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{PATTERNS_CACHE_VERSION}|{keyword}|{platform}|".encode())
+        digest.update(json.dumps(window, sort_keys=True, default=str).encode())
+        cache_file = PATTERNS_CACHE_DIR / f"{digest.hexdigest()}.json"
+
+        try:
+            cached = _json_loads(cache_file.read_bytes())
+            cached["hook_formats"] = Counter(cached.get("hook_formats", {}))
+            # Stamp this analysis, not the run that filled the cache
+            cached["analyzed_at"] = datetime.now().isoformat()
+            return cached
+        except (OSError, ValueError, AttributeError):
+            pass
+
+        patterns = self.analyzer.analyze(window, keyword)
+
+        # Write atomically so a concurrent reader never sees a partial file
+        try:
+            PATTERNS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=PATTERNS_CACHE_DIR, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(_json_bytes(patterns))
+            os.replace(tmp_path, cache_file)
+        except OSError as e:
+            logger.debug(f"Could not cache patterns for '{keyword}': {e}")
+
+        return patterns
+
     def _load_posts(self, keyword: str, platform: str, top_n: int) -> List[dict]:
         """Load ranked posts from storage. Falls back to Meta Ad Library data."""
-        slug = keyword.lower().replace(" ", "-").replace("/", "-").lstrip("#")
+        slug = keyword.lower().translate(_SLUG_TABLE).lstrip("#")
 
         # 1. Facebook/Instagram organic posts
         ranked_file = Path(RESEARCH_BASE) / platform / "posts" / slug / "ranked.json"
         if ranked_file.exists():
-            with open(ranked_file) as f:
-                return json.load(f)[:top_n]
+            return list(_load_json_head(str(ranked_file), ranked_file.stat().st_mtime_ns, top_n))
 
         # 2. SQLite (organic)
         posts = self.storage.get_top_posts(keyword, platform, limit=top_n)
@@ -391,11 +746,10 @@ class AdBriefGenerator:
         # 3. Meta Ad Library — normalize fields to match pattern analyzer
         ad_lib_file = Path(RESEARCH_BASE) / "meta-ad-library" / "ads" / slug / "ads.json"
         if ad_lib_file.exists():
-            with open(ad_lib_file) as f:
-                ads = json.load(f)
+            ads = _load_json_head(str(ad_lib_file), ad_lib_file.stat().st_mtime_ns, top_n)
             # Normalize Ad Library fields → organic post shape
             normalized = []
-            for ad in ads[:top_n]:
+            for ad in ads:
                 normalized.append({
                     "id": ad.get("id", ""),
                     "url": ad.get("advertiser_url", ""),
@@ -432,14 +786,15 @@ class AdBriefGenerator:
     def _build_brief(
         self,
         keyword: str,
+        product_key: str,
         product: dict,
         patterns: dict,
         posts: List[dict],
     ) -> dict:
         """Build the full ad brief."""
         # Pick best hook format from patterns
-        hook_formats = patterns.get("hook_formats", {})
-        best_format = max(hook_formats, key=hook_formats.get) if hook_formats else "question"
+        hook_formats = patterns.get("hook_formats") or Counter()
+        best_format = hook_formats.most_common(1)[0][0] if hook_formats else "question"
 
         # Generate hooks based on winning format + product
         hooks = self._generate_hooks(product, best_format, patterns, posts)
@@ -462,7 +817,7 @@ class AdBriefGenerator:
             "generated_at": datetime.now().isoformat(),
             "keyword": keyword,
             "product": product["name"],
-            "product_key": next((k for k, v in PRODUCTS.items() if v == product), ""),
+            "product_key": product_key,
             "target_audience": f"People searching for '{keyword}'",
 
             # Content strategy
@@ -475,7 +830,7 @@ class AdBriefGenerator:
 
             # Caption
             "suggested_caption": caption,
-            "suggested_hashtags": patterns.get("top_hashtags", [])[:10],
+            "suggested_hashtags": tuple(islice(patterns.get("top_hashtags", []), 10)),
             "suggested_cta": product["cta"],
 
             # Patterns from research
@@ -512,31 +867,19 @@ class AdBriefGenerator:
         top_hooks = patterns.get("top_hooks", [])
         # Build competitor brand word set from ALL posts (author names + capitalized words in hooks)
         # This ensures every hook gets filtered, not just those from top_posts
-        competitor_names = set()
-        _common_words = {
-            "the", "this", "that", "when", "what", "with", "from", "your", "here",
-            "stop", "just", "have", "been", "they", "will", "more", "most", "some",
-            "into", "over", "after", "every", "still", "even", "only", "also", "then",
-            "than", "their", "there", "these", "those", "about", "which", "while",
-            "business", "people", "time", "work", "free", "best", "rest", "learn",
-            "digital", "marketing", "online", "program", "week", "weeks", "month",
-        }
+        candidates = set()
         for p in (posts or []):
             # Author name words
             author = p.get("author_name", p.get("author", ""))
             if author:
-                for word in re.split(r"[\s\-_/&]+", author):
-                    w = word.lower().strip(".,!?")
-                    if len(w) > 3 and w not in _common_words:
-                        competitor_names.add(w)
+                candidates.update(word.strip(".,!?") for word in _AUTHOR_SPLIT_RE.split(author.lower()))
             # Capitalized words in ad text (brand names, product names)
             text = p.get("text_content", p.get("caption", "")) or ""
-            for word in re.findall(r"\b[A-Z][a-z]{2,}\b", text):
-                w = word.lower()
-                if w not in _common_words and len(w) > 3:
-                    competitor_names.add(w)
+            candidates.update(word.lower() for word in _CAP_WORD_RE.findall(text))
+        competitor_names = {w for w in candidates if len(w) > 3} - _COMMON_WORDS
+        contains_brand = _brand_matcher(competitor_names)
         for raw_hook in top_hooks[:8]:
-            adapted = self._adapt_hook(raw_hook, product, competitor_names)
+            adapted = self._adapt_hook(raw_hook, product, contains_brand)
             if adapted and adapted not in hooks:
                 hooks.append(adapted)
 
@@ -589,7 +932,12 @@ class AdBriefGenerator:
 
         return unique[:8]
 
-    def _adapt_hook(self, hook: str, product: dict, competitor_names: set = None) -> str:
+    def _adapt_hook(
+        self,
+        hook: str,
+        product: dict,
+        contains_brand: Optional[Callable[[str], bool]] = None,
+    ) -> str:
         """
         Adapt a real competitor hook to our product by:
         1. Keeping the emotional/structural pattern
@@ -601,36 +949,24 @@ class AdBriefGenerator:
 
         hook_lower = hook.lower()
 
-        # Skip video metadata artifacts and known junk
-        skip_always = [
-            "sorry, we're having trouble", "0:00 /", "log in", "to see this content",
-            "confirm your age", "sponsored", "library id", "http", "www.", "@",
-        ]
-        if any(p in hook_lower for p in skip_always):
-            return ""
-
-        # Skip hooks containing URLs or domain extensions
-        if re.search(r"\b\w+\.(com|io|co|net|org|app|ai)\b", hook_lower):
+        # Skip video metadata artifacts, URLs/domains, @handles and
+        # hashtags (competitor-branded)
+        if _ADAPT_REJECT_RE.search(hook_lower):
             return ""
 
         # Skip hooks containing competitor brand names (dynamic)
-        if competitor_names:
-            for brand_word in competitor_names:
-                if brand_word in hook_lower:
-                    return ""
-
-        # Skip hooks with hashtags (competitor-branded)
-        if "#" in hook:
+        if contains_brand and contains_brand(hook_lower):
             return ""
 
         # Skip hooks that are too long — trim to first sentence
         if len(hook) > 150:
-            first_sentence = re.split(r"[.!?\n]", hook)[0].strip()
+            first_sentence = _SENTENCE_SPLIT_RE.split(hook, 1)[0].strip()
             if len(first_sentence) < 15:
                 return ""
             hook = first_sentence
 
         adapted = hook.strip()
+        adapted_lower = adapted.lower()
 
         # Structural rewrites based on hook pattern
         pain = product["pain_points"][0] if product["pain_points"] else ""
@@ -640,19 +976,18 @@ class AdBriefGenerator:
         # Question hooks → reframe around our pain point
         if adapted.endswith("?") and len(adapted) < 100:
             # Keep the question structure, swap subject matter
-            question_words = ["why", "what if", "how", "are you", "do you", "have you"]
-            if any(adapted.lower().startswith(w) for w in question_words):
+            if adapted_lower.startswith(_QUESTION_PREFIXES):
                 # Return as-is if it's short and punchy — competitor questions are gold
                 return adapted[:120]
 
         # Stat/number hooks → keep the number pattern
-        stat_match = re.search(r"(\d+[\d,.]*\s*(?:%|x|hours?|minutes?|days?|months?|years?|people|million|billion|\$[\d,]+))", adapted, re.I)
+        stat_match = _STAT_RE.search(adapted)
         if stat_match:
             # Keep the stat hook as-is — numbers are universally compelling
             return adapted[:120]
 
         # Story hooks starting with "I" → keep personal voice
-        if adapted.lower().startswith(("i ", "we ", "my ")):
+        if adapted_lower.startswith(_STORY_PREFIXES):
             return adapted[:120]
 
         # Bold claim hooks → keep as inspiration note
@@ -660,7 +995,7 @@ class AdBriefGenerator:
             return adapted
 
         # Long hooks → take just the first sentence
-        first_sentence = re.split(r"[.!?\n]", adapted)[0].strip()
+        first_sentence = _SENTENCE_SPLIT_RE.split(adapted, 1)[0].strip()
         if len(first_sentence) > 15:
             return first_sentence[:120]
 
@@ -710,30 +1045,22 @@ class AdBriefGenerator:
         """Generate a Sora video prompt based on the ad brief."""
         is_vertical = content_type in ("reel", "video", "short")
 
-        prompt = (
-            f"@isaiahdupree standing confidently in a modern, well-lit studio space, "
-            f"speaking directly to camera with energy and authenticity. "
-            f"He's wearing his signature casual hoodie and gold chain. "
-            f"The background shows a clean workspace with subtle tech elements. "
-            f"He opens with: \"{hook[:80]}\" — gesturing naturally as he speaks. "
-            f"The camera starts with a close-up on his face, then pulls back to reveal "
-            f"a screen behind him showing {product['name']}. "
-            f"Warm, natural lighting. Vertical {'9:16' if is_vertical else '16:9'} format. "
-            f"Cinematic but authentic, like a high-quality social media video."
-        )
-
-        return prompt
+        return _SORA_PROMPT_TMPL % {
+            "hook": hook,
+            "product_name": product["name"],
+            "aspect": "9:16" if is_vertical else "16:9",
+        }
 
     def _generate_insights(self, patterns: dict, keyword: str) -> str:
         """Generate human-readable competitor insights."""
         avg_reactions = patterns.get("avg_reactions", 0)
         avg_comments = patterns.get("avg_comments", 0)
         top_types = patterns.get("best_content_types", [])
-        top_hooks_fmt = patterns.get("hook_formats", {})
-        top_hashtags = patterns.get("top_hashtags", [])[:5]
+        top_hooks_fmt = patterns.get("hook_formats") or Counter()
+        top_hashtags = islice(patterns.get("top_hashtags", []), 5)
 
         best_type = top_types[0] if top_types else "video"
-        best_hook = max(top_hooks_fmt, key=top_hooks_fmt.get) if top_hooks_fmt else "question"
+        best_hook = top_hooks_fmt.most_common(1)[0][0] if top_hooks_fmt else "question"
 
         return (
             f"For '{keyword}': Top posts average {avg_reactions:,} reactions and {avg_comments:,} comments. "
@@ -744,67 +1071,70 @@ class AdBriefGenerator:
 
     def _save_brief(self, brief: dict, keyword: str, product_key: str):
         """Save ad brief to file."""
-        briefs_dir = Path(RESEARCH_BASE) / "ad-briefs"
-        briefs_dir.mkdir(parents=True, exist_ok=True)
+        briefs_dir = BRIEFS_DIR
+        if not self._briefs_dir_ready:
+            briefs_dir.mkdir(parents=True, exist_ok=True)
+            self._briefs_dir_ready = True
 
-        date_str = datetime.now().strftime("%Y-%m-%d")
-        slug = keyword.lower().replace(" ", "-").lstrip("#")
+        date_str = self.run_date or date.today().isoformat()
+        slug = keyword.lower().translate(_SLUG_TABLE).lstrip("#")
         filename = f"{date_str}-{slug}-{product_key}.json"
         filepath = briefs_dir / filename
 
-        with open(filepath, "w") as f:
-            json.dump(brief, f, indent=2)
+        filepath.write_bytes(_json_bytes(brief, indent=True))
+        self._append_brief_index(brief, briefs_dir, filename)
 
         logger.info(f"💡 Ad brief saved → {filepath}")
 
         # Also generate a readable markdown version
-        self._save_brief_md(brief, briefs_dir, filename.replace(".json", ".md"))
+        if self.write_md:
+            self._save_brief_md(brief, briefs_dir, filename.replace(".json", ".md"))
+
+    def save_bundle(self, briefs: List[dict]) -> Path:
+        """Save briefs as one JSONL file (one brief per line) in a single write."""
+        briefs_dir = BRIEFS_DIR
+        if not self._briefs_dir_ready:
+            briefs_dir.mkdir(parents=True, exist_ok=True)
+            self._briefs_dir_ready = True
+
+        date_str = self.run_date or date.today().isoformat()
+        filepath = briefs_dir / f"{date_str}-run-{uuid.uuid4().hex[:8]}.jsonl"
+        filepath.write_bytes(b"".join(_json_bytes(brief) + b"\n" for brief in briefs))
+
+        logger.info(f"💡 {len(briefs)} ad briefs saved → {filepath}")
+        return filepath
+
+    def _append_brief_index(self, brief: dict, directory: Path, filename: str):
+        """Append the brief's listing summary to the briefs index."""
+        row = {
+            "name": filename,
+            "product": brief["product"],
+            "keyword": brief["keyword"],
+            "primary_hook": brief["primary_hook"],
+        }
+        # One small append per line keeps concurrent savers from interleaving
+        with open(directory / BRIEFS_INDEX_FILE, "ab") as f:
+            f.write(_json_bytes(row) + b"\n")
 
     def _save_brief_md(self, brief: dict, directory: Path, filename: str):
         """Save a human-readable markdown version of the brief."""
-        lines = [
-            f"# Ad Brief: {brief['product']} × \"{brief['keyword']}\"",
-            f"**Generated:** {brief['generated_at'][:10]}  ",
-            f"**Format:** {brief['recommended_format']} | **Platform:** {brief['recommended_platform']}",
-            "",
-            "---",
-            "",
-            "## Hooks (pick one)",
-            "",
-        ]
-        for i, hook in enumerate(brief.get("hooks", []), 1):
-            lines.append(f"{i}. {hook}")
-
-        lines.extend([
-            "",
-            "## Suggested Caption",
-            "",
-            "```",
-            brief.get("suggested_caption", ""),
-            "```",
-            "",
-            "## Sora Video Prompt",
-            "",
-            "```",
-            brief.get("sora_prompt", ""),
-            "```",
-            "",
-            "## Hashtags",
-            "",
-            " ".join(brief.get("suggested_hashtags", [])),
-            "",
-            "## Competitor Insights",
-            "",
-            brief.get("competitor_insights", ""),
-            "",
-            "## Inspiration Posts",
-            "",
-        ])
-        for url in brief.get("inspiration_posts", []):
-            lines.append(f"- {url}")
-
-        with open(directory / filename, "w") as f:
-            f.write("\n".join(lines))
+        lines = [_MD_BRIEF_HEAD.format(
+            product=brief["product"],
+            keyword=brief["keyword"],
+            date=brief["generated_at"][:10],
+            format=brief["recommended_format"],
+            platform=brief["recommended_platform"],
+        )]
+        lines += [f"{i}. {hook}" for i, hook in enumerate(brief.get("hooks", []), 1)]
+        lines.append(_MD_BRIEF_BODY.format(
+            caption=brief.get("suggested_caption", ""),
+            sora_prompt=brief.get("sora_prompt", ""),
+            hashtags=" ".join(brief.get("suggested_hashtags", [])),
+            insights=brief.get("competitor_insights", ""),
+        ))
+        lines += [f"- {url}" for url in brief.get("inspiration_posts", [])]
+
+        (directory / filename).write_bytes("\n".join(lines).encode("utf-8"))
 
 
 class ResearchPipeline:
@@ -813,9 +1143,10 @@ class ResearchPipeline:
     keywords → scrape → rank → analyze → ad brief → Sora prompt
     """
 
-    def __init__(self):
-        self.storage = ResearchStorage()
-        self.brief_gen = AdBriefGenerator()
+    def __init__(self, write_md: bool = False):
+        self.storage = _shared_storage()
+        # Batch runs skip the markdown copies unless asked for them
+        self.brief_gen = AdBriefGenerator(write_md=write_md)
 
     def run(
         self,
@@ -825,6 +1156,7 @@ class ResearchPipeline:
         max_per_keyword: int = 50,
         download_top: int = 10,
         skip_scrape: bool = False,
+        bundle: bool = False,
     ) -> List[dict]:
         """
         Full pipeline run.
@@ -836,6 +1168,8 @@ class ResearchPipeline:
             max_per_keyword: Max posts per keyword per platform
             download_top: Download media for top N posts
             skip_scrape: Skip scraping, use existing data
+            bundle: Save all briefs to one <date>-run-<id>.jsonl file
+                instead of a JSON (+ markdown) file per brief
 
         Returns:
             List of generated ad briefs
@@ -859,26 +1193,30 @@ class ResearchPipeline:
                 ig.batch_search(keywords, search_type="hashtag", max_per_keyword=max_per_keyword, download_top=download_top)
 
         # Generate ad briefs for each keyword × platform
-        for keyword in keywords:
-            for platform in platforms:
-                logger.info(f"\n💡 Generating ad brief: '{keyword}' × {product_key} [{platform}]")
-                brief = self.brief_gen.generate(keyword, product_key, platform=platform)
-                if brief:
-                    briefs.append(brief)
-                    self._print_brief_summary(brief)
+        jobs = [(keyword, product_key, platform) for keyword in keywords for platform in platforms]
+        self.brief_gen.run_date = date.today().isoformat()
+        logger.info(f"\n💡 Generating {len(jobs)} ad briefs for {product_key}")
+        for brief in self.brief_gen.generate_batch(jobs, save=not bundle):
+            if brief:
+                briefs.append(brief)
+                self._print_brief_summary(brief)
+
+        if bundle and briefs:
+            self.brief_gen.save_bundle(briefs)
 
         return briefs
 
     def _print_brief_summary(self, brief: dict):
-        print(f"\n{'─' * 60}")
-        print(f"💡 AD BRIEF: {brief['product']} × '{brief['keyword']}'")
-        print(f"{'─' * 60}")
-        print(f"  Format:  {brief['recommended_format']}")
-        print(f"  Hook:    {brief['primary_hook'][:80]}")
-        print(f"  CTA:     {brief['suggested_cta']}")
-        print(f"  Hashtags: {' '.join(brief['suggested_hashtags'][:5])}")
-        print(f"  Insights: {brief['competitor_insights'][:100]}...")
-        print()
+        sys.stdout.write(_BRIEF_SUMMARY_TMPL.format(
+            rule="─" * 60,
+            product=brief["product"],
+            keyword=brief["keyword"],
+            format=brief["recommended_format"],
+            hook=brief["primary_hook"],
+            cta=brief["suggested_cta"],
+            hashtags=" ".join(islice(brief["suggested_hashtags"], 5)),
+            insights=brief["competitor_insights"],
+        ))
 
 
 # ── CLI ──
@@ -892,23 +1230,26 @@ def main():
     # generate brief
     g = sub.add_parser("brief", help="Generate ad brief from research data")
     g.add_argument("keyword", help="Researched keyword")
-    g.add_argument("--product", required=True, choices=list(PRODUCTS.keys()), help="Product to create brief for")
+    g.add_argument("--product", required=True, choices=_PRODUCT_KEYS, help="Product to create brief for")
     g.add_argument("--platform", default="facebook", choices=["facebook", "instagram"])
     g.add_argument("--top", type=int, default=20)
 
     # full pipeline
     p = sub.add_parser("pipeline", help="Full research + brief pipeline")
     p.add_argument("--keywords", required=True, help="Comma-separated keywords")
-    p.add_argument("--product", required=True, choices=list(PRODUCTS.keys()))
+    p.add_argument("--product", required=True, choices=_PRODUCT_KEYS)
     p.add_argument("--platforms", default="facebook,instagram")
     p.add_argument("--max-per-keyword", type=int, default=50)
     p.add_argument("--skip-scrape", action="store_true", help="Use existing data, skip scraping")
+    p.add_argument("--markdown", action="store_true", help="Also write a markdown copy of each brief")
+    p.add_argument("--bundle", action="store_true", help="Save all briefs to one JSONL file for the run")
 
     # list products
     sub.add_parser("products", help="List available products")
 
     # list briefs
-    sub.add_parser("briefs", help="List generated ad briefs")
+    b = sub.add_parser("briefs", help="List generated ad briefs")
+    b.add_argument("--full", action="store_true", help="Load each brief and show its format, platform and CTA")
 
     args = parser.parse_args()
 
@@ -924,12 +1265,13 @@ def main():
     elif args.command == "pipeline":
         keywords = [k.strip() for k in args.keywords.split(",")]
         platforms = [p.strip() for p in args.platforms.split(",")]
-        pipeline = ResearchPipeline()
+        pipeline = ResearchPipeline(write_md=args.markdown)
         briefs = pipeline.run(
             keywords=keywords,
             product_key=args.product,
             platforms=platforms,
             skip_scrape=args.skip_scrape,
+            bundle=args.bundle,
         )
         print(f"\n✅ Generated {len(briefs)} ad briefs")
 
@@ -941,18 +1283,40 @@ def main():
             print()
 
     elif args.command == "briefs":
-        briefs_dir = Path(RESEARCH_BASE) / "ad-briefs"
+        briefs_dir = BRIEFS_DIR
         if not briefs_dir.exists():
             print("No briefs generated yet.")
             return
-        briefs = sorted(briefs_dir.glob("*.json"), reverse=True)
+        # Newest first, straight from the directory entries - no file opens
+        with os.scandir(briefs_dir) as it:
+            entries = [(e.stat().st_mtime, e.name) for e in it if e.name.endswith(".json")]
+        briefs = [name for _, name in sorted(entries, reverse=True)]
+
+        # Later index lines win, so a re-saved brief shows its latest hook
+        index = {}
+        index_file = briefs_dir / BRIEFS_INDEX_FILE
+        if not args.full and index_file.exists():
+            with open(index_file, "rb") as f:
+                for line in f:
+                    try:
+                        row = _json_loads(line)
+                        index[row["name"]] = row
+                    except (ValueError, KeyError, TypeError):
+                        continue
+
         print(f"\n{len(briefs)} ad briefs:\n")
-        for b in briefs:
-            with open(b) as f:
-                data = json.load(f)
-            print(f"  {b.name}")
+        for name in briefs:
+            # Briefs saved before the index existed are parsed directly
+            data = None if args.full else index.get(name)
+            if data is None:
+                data = _json_loads((briefs_dir / name).read_bytes())
+            print(f"  {name}")
             print(f"    {data.get('product', '?')} × '{data.get('keyword', '?')}'")
             print(f"    Hook: {data.get('primary_hook', '')[:70]}")
+            if args.full:
+                print(f"    Format: {data.get('recommended_format', '?')} | "
+                      f"Platform: {data.get('recommended_platform', '?')} | "
+                      f"CTA: {data.get('suggested_cta', '?')}")
             print()
 
     else:
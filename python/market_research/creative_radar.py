@@ -18,676 +18,311 @@ Usage:
   radar.mine_patterns()     # extract primitives
   radar.generate_briefs()   # 5-stage briefs
   radar.report()            # full dashboard
+
+Offer specs (OFFER_SPECS[key], radar.spec) are shared, read-only objects:
+tuples, frozensets and MappingProxyType views throughout. Read them
+directly; there is no need to copy one before use.
 """
 import json
 import re
 import os
+import sys
 import time
 from pathlib import Path
+from types import MappingProxyType
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
-from collections import Counter
+from collections import Counter, namedtuple
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from loguru import logger
 
+# orjson is optional - faster parse of offer specs and research JSON
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# pyahocorasick is optional - matches all of an offer's search keywords
+# against a post in one pass instead of one substring scan per keyword
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
 RESEARCH_BASE = Path(os.path.expanduser("~/market-research"))
 
 # ═══════════════════════════════════════════════════════════════
 # 1. OFFER SPECS — offer-agnostic product configs
 # ═══════════════════════════════════════════════════════════════
 
-OFFER_SPECS: Dict[str, dict] = {
-    "everreach": {
-        "name": "EverReach",
-        "tagline": "A personal CRM that turns care into a repeatable rhythm",
-        "url": "everreach.app",
-        "cta": "Start Free Trial",
-
-        # ICP — who is this for
-        "icp": [
-            "Adults 22-45 who feel guilty about losing touch",
-            "People with ADHD who struggle with follow-through on relationships",
-            "Solopreneurs/creators whose pipeline leaks from no follow-up system",
-            "Networkers who want relationship capital without feeling spammy",
-        ],
-
-        # Job-to-be-done — what they're trying to accomplish
-        "jtbd": [
-            "Stay close to people I care about without it feeling forced",
-            "Remember to follow up before it's awkward",
-            "Turn relationships into a sustainable rhythm, not a guilt cycle",
-        ],
-
-        # Pains & objections — what stops them
-        "pains": [
-            "friendships drifting apart",
-            "forgetting to follow up",
-            "not knowing what to say after a long silence",
-            "relationships fading when life gets busy",
-            "DMs/texts are a graveyard of good intentions",
-            "ADHD makes consistency feel impossible",
-        ],
-        "objections": [
-            "this feels spammy / corporate",
-            "I don't need an app to be a good friend",
-            "I'll just use reminders / my calendar",
-            "sounds like too much work",
-            "another subscription I won't use",
-        ],
-
-        # Desired transformation — the 'after' state
-        "transformation": [
-            "I'm the type of person who shows up for people",
-            "My relationships have a rhythm, not a guilt cycle",
-            "I reconnected with 8 people I love and 2 became opportunities",
-        ],
-
-        # Core mechanism — the unique 'how'
-        "mechanism": "Top people list + warmth score + gentle reminders + message starters",
-        "mechanism_short": "rhythm > motivation",
-
-        # Product features (for proof beats)
-        "features": [
-            "Top people list + warmth score — see who needs attention",
-            "Gentle reminders so no one slips through the cracks",
-            "Message starters when your brain goes blank",
-        ],
-
-        # Creative constraints
-        "formats_preferred": ["UGC vertical video", "founder-to-camera", "screen recording demo", "carousel"],
-        "formats_avoid": ["stock footage", "corporate B-roll", "listicle without emotion"],
-        "brand_safety": ["no shaming language", "no 'you're a bad friend' framing", "warm not preachy"],
-
-        # Discovery keywords — what the ICP searches for
-        "search_keywords": {
-            "guilt_overwhelm": [
-                "how to stop ghosting people",
-                "I forget to text back",
-                "overwhelmed socially",
-                "reconnect with friends",
-                "what to say when you disappeared",
-                "unghosting scripts",
-            ],
-            "adult_friendships": [
-                "how to maintain friendships as an adult",
-                "adult friendship",
-                "check in on friends",
-                "staying connected",
-                "friendship habits",
-            ],
-            "networking_followup": [
-                "networking follow up",
-                "follow up message after meeting",
-                "personal CRM",
-                "relationship building networking",
-                "relationship capital",
-            ],
-            "solopreneur_pipeline": [
-                "client follow up system",
-                "CRM for freelancers",
-                "warm leads nurture",
-                "creator outreach",
-            ],
-            "tools_systems": [
-                "personal crm app",
-                "relationship tracker app",
-                "contact reminder app",
-                "follow up app",
-                "stay in touch app",
-                "friendship tracker",
-            ],
-        },
-
-        # Hashtags the ICP follows
-        "hashtags": [
-            "#adultfriendships", "#socialanxiety", "#adhd", "#peoplepleasing",
-            "#selfimprovement", "#communicationtips", "#networking", "#careeradvice",
-            "#personalgrowth", "#relationshipbuilding", "#professionaldevelopment",
-            "#intentionalliving", "#personalcrm",
-        ],
-
-        # Schwartz awareness-stage hooks
-        "awareness_hooks": {
-            "unaware": {
-                "hook": "most friendships don't end — they drift",
-                "goal": "create emotional recognition, no product",
-                "cta": "save / comment (NOT download)",
-                "script": [
-                    "most friendships don't end they drift",
-                    "you care you just get busy and time disappears",
-                    "the goal isn't to catch up it's to make the next message normal again",
-                    "that takes a rhythm not motivation",
-                    "i built a simple system for that — link in bio",
-                ],
-            },
-            "problem_aware": {
-                "hook": "the longer you wait, the more awkward it feels",
-                "goal": "name the enemy, agitate, hint at relief",
-                "cta": "comment keyword for templates",
-                "script": [
-                    "the longer you wait the more awkward it feels",
-                    "then you overthink then you send nothing",
-                    "and months turn into distance",
-                    "so here's the fix — a tiny check in rhythm plus message starters",
-                    "i use a personal crm that reminds me who to check in on",
-                ],
-            },
-            "solution_aware": {
-                "hook": "stop doing relationships from memory",
-                "goal": "introduce mechanism (rhythm + list + starters)",
-                "cta": "comment for the method / follow",
-                "script": [
-                    "stop doing relationships from memory",
-                    "memory fails when life gets loud",
-                    "here's the rhythm — top people list, weekly rotation, and starters",
-                    "download everreach — start your free trial",
-                ],
-            },
-            "product_aware": {
-                "hook": "if you want to stay close without overthinking, this is the tool",
-                "goal": "demo 3 features → 1 outcome",
-                "cta": "download / start trial",
-                "script": [
-                    "if you want to stay close without overthinking this is the tool",
-                    "feature one — top people list and warmth score",
-                    "feature two — last touch and gentle reminders",
-                    "feature three — message starters when your brain is blank",
-                    "the goal isn't to catch up — it's to make the next message normal again",
-                    "start free trial",
-                ],
-            },
-            "most_aware": {
-                "hook": "this is not spammy — it's a reminder to be human",
-                "goal": "kill objections directly",
-                "cta": "start free trial, no pressure",
-                "script": [
-                    "this is not spammy it's a reminder to be human",
-                    "you choose your circle and how often you want to check in",
-                    "it gives you starters so it never feels awkward",
-                    "cancel anytime no pressure",
-                    "start the free trial and see if it fits",
-                ],
-            },
-        },
-
-        # FATE framework
-        "fate": {
-            "familiarity": "You care. You just get busy and time disappears.",
-            "authority": "I built a simple system for that.",
-            "trust": "Show: list → reminder → message starter → send",
-            "emotion": "Relief + identity: 'I'm the type of person who shows up for people.'",
-        },
-    },
-
-    # ───────────────────────────────────────────────────────────
-    # SteadyLetters — Physical mail SaaS
-    # ───────────────────────────────────────────────────────────
-    "steadyletters": {
-        "name": "SteadyLetters",
-        "tagline": "Send real letters that actually get opened",
-        "url": "steadyletters.com",
-        "cta": "Send Your First Letter Free",
-
-        "icp": [
-            "Small business owners who want to stand out in a digital-first world",
-            "Real estate agents / insurance brokers who rely on repeat + referral",
-            "E-commerce brands wanting to boost retention with a personal touch",
-            "Creators / coaches who want a premium touchpoint with VIP clients",
-        ],
-
-        "jtbd": [
-            "Send personalized physical mail without going to the post office",
-            "Automate thank-you cards, follow-ups, and holiday mailers at scale",
-            "Convert digital relationships into tangible, memorable moments",
-        ],
-
-        "pains": [
-            "email open rates are dying",
-            "digital ads feel impersonal and get ignored",
-            "no time to handwrite cards or go to the post office",
-            "mailchimp / email fatigue — everyone is in the inbox",
-            "losing clients to competitors who feel more personal",
-            "want to send thank-you notes but never follow through",
-        ],
-        "objections": [
-            "physical mail is dead / outdated",
-            "too expensive per piece vs email",
-            "I don't have time to design mailers",
-            "my customers don't check their mailbox",
-            "sounds like junk mail",
-        ],
-
-        "transformation": [
-            "My clients tell me 'that letter made my day'",
-            "I send 50 thank-you cards a month without lifting a pen",
-            "My retention rate jumped because people remember physical mail",
-        ],
-
-        "mechanism": "AI letter generation + handwriting fonts + voice-to-letter + Thanks.io print & mail API",
-        "mechanism_short": "type it → we print & mail it",
-
-        "features": [
-            "AI letter writer — describe what you want to say, get a perfect letter",
-            "Voice-to-letter — record a voice memo, we turn it into a handwritten card",
-            "Handwriting styles — pick from realistic handwriting fonts",
-            "Postcards, letters, and greeting cards — all formats",
-            "Bulk send — upload a CSV and mail 500 letters in one click",
-        ],
-
-        "formats_preferred": ["before/after demos", "unboxing reaction videos", "screen recording walkthrough", "testimonial UGC"],
-        "formats_avoid": ["corporate B2B style", "stock photo mailers", "hard-sell infomercial"],
-        "brand_safety": ["no spam framing", "no 'junk mail' language", "warm and premium tone"],
-
-        "search_keywords": {
-            "mail_marketing": [
-                "direct mail marketing",
-                "send handwritten letters",
-                "physical mail marketing",
-                "direct mail for small business",
-                "handwritten note service",
-            ],
-            "retention": [
-                "customer retention strategies",
-                "thank you card for clients",
-                "client appreciation ideas",
-                "how to stand out as a business",
-                "personal touch marketing",
-            ],
-            "real_estate": [
-                "real estate farming letters",
-                "real estate mailer ideas",
-                "just sold postcards",
-                "real estate thank you note",
-            ],
-            "ecommerce": [
-                "ecommerce retention",
-                "post purchase experience",
-                "unboxing experience ideas",
-                "handwritten note in package",
-            ],
-        },
-
-        "hashtags": [
-            "#directmail", "#handwrittennotes", "#smallbusinesstips", "#clientappreciation",
-            "#realestatemark", "#customerretention", "#personaltouchmarketing",
-            "#thankyoucards", "#mailmarketing", "#businessgrowth",
-        ],
-
-        "awareness_hooks": {
-            "unaware": {
-                "hook": "your customers remember a letter longer than 100 emails",
-                "goal": "pattern interrupt — physical > digital",
-                "cta": "save / share",
-                "script": [
-                    "your customers remember a letter longer than 100 emails",
-                    "in a world of inboxes and notifications a real letter stops people cold",
-                    "it's not about being old school it's about being unforgettable",
-                    "the businesses winning right now are the ones that feel personal",
-                ],
-            },
-            "problem_aware": {
-                "hook": "your emails are getting ignored — here's what actually gets opened",
-                "goal": "agitate email fatigue, tease physical mail",
-                "cta": "comment LETTER for the strategy",
-                "script": [
-                    "email open rates are at 20 percent and falling",
-                    "your best customers are drowning in digital noise",
-                    "but a handwritten letter? 99 percent open rate",
-                    "because nobody throws away a real letter without reading it",
-                ],
-            },
-            "solution_aware": {
-                "hook": "I send 50 personalized letters a month without touching a pen",
-                "goal": "reveal mechanism — AI + handwriting + auto-mail",
-                "cta": "follow for the full walkthrough",
-                "script": [
-                    "I send 50 personalized letters a month without touching a pen",
-                    "I type what I want to say or just record a voice memo",
-                    "AI writes the letter in a handwriting font that looks real",
-                    "it prints and mails automatically — my clients love it",
-                ],
-            },
-            "product_aware": {
-                "hook": "this app sends real handwritten letters for you",
-                "goal": "demo the product — voice to letter + preview + send",
-                "cta": "send your first letter free",
-                "script": [
-                    "this app sends real handwritten letters for you",
-                    "step one record what you want to say",
-                    "step two pick a handwriting style and card type",
-                    "step three preview and send — it arrives in 3 to 5 days",
-                    "send your first letter free right now",
-                ],
-            },
-            "most_aware": {
-                "hook": "yes real mail still works — here's the proof",
-                "goal": "testimonials + objection killing",
-                "cta": "try free — no subscription required for first letter",
-                "script": [
-                    "yes real mail still works — here's the proof",
-                    "98 percent of direct mail gets opened versus 20 percent for email",
-                    "our users see 3x higher response rates on thank you letters",
-                    "it's not junk mail when it's personal and handwritten",
-                    "try it free — send your first letter today",
-                ],
-            },
-        },
-
-        "fate": {
-            "familiarity": "Your inbox is full. Your mailbox isn't.",
-            "authority": "We've sent 10,000+ letters for small businesses.",
-            "trust": "Show: voice memo → AI letter → handwriting preview → arrives at door",
-            "emotion": "Delight: 'my client called me just to say thank you for the letter.'",
-        },
-    },
-
-    # ───────────────────────────────────────────────────────────
-    # VelvetHold — Deposit-based date reservation
-    # ───────────────────────────────────────────────────────────
-    "velvethold": {
-        "name": "VelvetHold",
-        "tagline": "Stop no-shows with a simple deposit link",
-        "url": "velvethold.com",
-        "cta": "Create Your First Hold",
-
-        "icp": [
-            "Hairstylists / barbers / lash techs / nail artists who lose money to no-shows",
-            "Personal trainers / coaches / consultants who need commitment before booking",
-            "Tattoo artists / photographers / event planners who need deposits",
-            "Any service provider tired of wasted time slots",
-        ],
-
-        "jtbd": [
-            "Collect a deposit before confirming a booking so clients show up",
-            "Send a simple link — no app download, no friction for the client",
-            "Eliminate the awkwardness of asking for money upfront",
-        ],
-
-        "pains": [
-            "clients book and don't show up",
-            "losing $200+ per no-show",
-            "feel awkward asking for deposits",
-            "current booking tools are too complicated",
-            "Venmo/Zelle deposits feel unprofessional",
-            "calendly doesn't collect deposits",
-        ],
-        "objections": [
-            "my clients won't pay a deposit",
-            "I'll lose bookings if I charge upfront",
-            "I already use Square / Calendly",
-            "sounds too complicated to set up",
-            "what if the client wants a refund",
-        ],
-
-        "transformation": [
-            "My no-show rate went from 30% to 2%",
-            "I stopped losing $800/month to people who don't show up",
-            "Clients actually respect my time now because they have skin in the game",
-        ],
-
-        "mechanism": "Custom deposit link + automatic hold + Stripe checkout + confirmation flow",
-        "mechanism_short": "link → deposit → confirmed",
-
-        "features": [
-            "Create a deposit link in 30 seconds — set amount, expiry, refund policy",
-            "Client pays via Stripe — no app download needed",
-            "Automatic confirmation + reminder emails",
-            "Refund or apply deposit to final bill with one click",
-        ],
-
-        "formats_preferred": ["rant-to-camera about no-shows", "before/after revenue screenshots", "tutorial walkthrough", "client reaction"],
-        "formats_avoid": ["corporate SaaS demo", "generic booking tool comparison"],
-        "brand_safety": ["no client-shaming", "empathetic to both sides", "professional tone"],
-
-        "search_keywords": {
-            "no_shows": [
-                "how to stop no shows",
-                "client no show policy",
-                "no show fee",
-                "how to deal with no shows",
-                "cancellation policy for small business",
-            ],
-            "deposits": [
-                "how to collect deposits",
-                "deposit for appointments",
-                "booking deposit",
-                "require deposit before booking",
-            ],
-            "service_providers": [
-                "hairstylist no show",
-                "tattoo artist deposit",
-                "personal trainer cancellation",
-                "photographer booking deposit",
-                "lash tech no shows",
-            ],
-        },
-
-        "hashtags": [
-            "#noshow", "#bookingdeposit", "#hairstylistlife", "#smallbusinesstips",
-            "#beautyindustry", "#serviceprovidertips", "#barbershop", "#lashtechlife",
-            "#tattooartist", "#cancellationpolicy",
-        ],
-
-        "awareness_hooks": {
-            "unaware": {
-                "hook": "you lost $200 today because someone didn't show up",
-                "goal": "emotional gut punch — normalize the problem",
-                "cta": "save / tag a friend who needs this",
-                "script": [
-                    "you lost $200 today because someone didn't show up",
-                    "and you probably didn't say anything because you didn't want to be rude",
-                    "but your time is worth money",
-                    "and there's a simple way to make sure people show up",
-                ],
-            },
-            "problem_aware": {
-                "hook": "no-shows are costing you more than you think",
-                "goal": "agitate with math — monthly loss calculation",
-                "cta": "comment NO SHOW if this is you",
-                "script": [
-                    "if you get 3 no-shows a week at $80 each",
-                    "that's $960 a month you're just giving away",
-                    "and it's not just money it's the time you blocked off",
-                    "the fix isn't a cancellation policy nobody reads",
-                    "the fix is getting money on the table before the appointment",
-                ],
-            },
-            "solution_aware": {
-                "hook": "the one change that dropped my no-shows to zero",
-                "goal": "reveal the deposit link mechanism",
-                "cta": "follow for the setup walkthrough",
-                "script": [
-                    "the one change that dropped my no-shows to zero",
-                    "I started sending a deposit link before confirming",
-                    "it takes 30 seconds to create and the client pays in one tap",
-                    "when they have $25 on the line they show up",
-                ],
-            },
-            "product_aware": {
-                "hook": "this tool lets you collect deposits with a single link",
-                "goal": "demo the flow — create link → client pays → confirmed",
-                "cta": "create your first hold free",
-                "script": [
-                    "this tool lets you collect deposits with a single link",
-                    "set your amount set your refund policy",
-                    "send the link via text or DM",
-                    "client pays in one tap — you get a confirmation",
-                    "no app download no friction",
-                ],
-            },
-            "most_aware": {
-                "hook": "if you're still dealing with no-shows you're choosing to lose money",
-                "goal": "direct close — social proof + urgency",
-                "cta": "create your first hold — it's free",
-                "script": [
-                    "if you're still dealing with no-shows you're choosing to lose money",
-                    "500 plus service providers already use this",
-                    "average no-show rate drops from 25 percent to under 3 percent",
-                    "create your first hold right now — it's free to start",
-                ],
-            },
-        },
-
-        "fate": {
-            "familiarity": "You've been ghosted by a client before. We all have.",
-            "authority": "Built by a service provider who was tired of losing money.",
-            "trust": "Show: create link → send via DM → client pays → confirmation ping",
-            "emotion": "Relief: 'I stopped losing $800/month and my schedule is full of people who actually show up.'",
-        },
-    },
-
-    # ───────────────────────────────────────────────────────────
-    # SnapMix — Snapchat-style track sharing for DJs/producers
-    # ───────────────────────────────────────────────────────────
-    "snapmix": {
-        "name": "SnapMix",
-        "tagline": "Share your mixes like stories — here today, gone tomorrow",
-        "url": "snapmix.app",
-        "cta": "Drop Your First Mix",
-
-        "icp": [
-            "DJs who want to share live sets without copyright takedowns",
-            "Bedroom producers who want feedback before releasing",
-            "Music curators who share playlists with their community",
-            "Artists who want to tease unreleased tracks with a time limit",
-        ],
-
-        "jtbd": [
-            "Share a DJ mix or unreleased track that auto-expires so I don't get DMCA'd",
-            "Get real-time reactions from my audience on new music",
-            "Build hype for releases with disappearing previews",
-        ],
-
-        "pains": [
-            "SoundCloud / Mixcloud take down mixes for copyright",
-            "can't share DJ sets anywhere without getting flagged",
-            "unreleased tracks leak when shared permanently",
-            "no good way to tease new music with urgency",
-            "social media compresses audio quality",
-        ],
-        "objections": [
-            "why not just use SoundCloud private links",
-            "my audience won't download another app",
-            "disappearing content is gimmicky",
-            "I just DM tracks to people",
-        ],
-
-        "transformation": [
-            "I drop a set every Friday and my audience shows up because it disappears Monday",
-            "I preview unreleased tracks with zero leak risk",
-            "My engagement doubled because urgency creates action",
-        ],
-
-        "mechanism": "Upload mix → set expiry timer → share link → listeners react in real-time → track auto-deletes",
-        "mechanism_short": "drop → expire → repeat",
-
-        "features": [
-            "Upload any audio file — mixes, sets, unreleased tracks",
-            "Set expiry: 24h, 48h, 1 week, or custom",
-            "Shareable link — no app download needed for listeners",
-            "Real-time reactions — listeners emoji-react as they listen",
-            "Play count + listen-through rate analytics",
-        ],
-
-        "formats_preferred": ["behind-the-decks footage", "studio session clips", "countdown hype reels", "reaction videos"],
-        "formats_avoid": ["corporate music industry content", "generic SaaS demos"],
-        "brand_safety": ["no piracy encouragement", "respect artist rights", "underground culture tone"],
-
-        "search_keywords": {
-            "dj_sharing": [
-                "how to share DJ mixes online",
-                "DJ mix copyright",
-                "share DJ set without takedown",
-                "best platform for DJ mixes",
-                "SoundCloud mix taken down",
-            ],
-            "music_preview": [
-                "preview unreleased music",
-                "tease new song",
-                "share music privately",
-                "send beats to clients",
-                "music feedback platform",
-            ],
-            "music_community": [
-                "DJ community app",
-                "share mixes with friends",
-                "underground music sharing",
-                "producer collaboration",
-            ],
-        },
-
-        "hashtags": [
-            "#djlife", "#djmix", "#producerlife", "#unreleased", "#newmusic",
-            "#beatmaker", "#musicproducer", "#djset", "#undergroundmusic",
-            "#mixcloud", "#soundcloud",
-        ],
-
-        "awareness_hooks": {
-            "unaware": {
-                "hook": "the best DJ sets never make it online because of copyright",
-                "goal": "call out the shared frustration",
-                "cta": "save if you've ever had a mix taken down",
-                "script": [
-                    "the best DJ sets never make it online because of copyright",
-                    "you spend hours mixing and one claim kills it",
-                    "so the best mixes just live on a hard drive",
-                    "that's about to change",
-                ],
-            },
-            "problem_aware": {
-                "hook": "SoundCloud just took down my best set — again",
-                "goal": "agitate copyright pain, hint at solution",
-                "cta": "comment if this has happened to you",
-                "script": [
-                    "SoundCloud just took down my best set again",
-                    "2 hours of mixing gone because of one flagged track",
-                    "private links still get caught",
-                    "there has to be a better way to share mixes",
-                ],
-            },
-            "solution_aware": {
-                "hook": "what if your mixes disappeared before copyright bots found them",
-                "goal": "introduce the ephemeral sharing concept",
-                "cta": "follow for the drop",
-                "script": [
-                    "what if your mixes disappeared before copyright bots found them",
-                    "drop a set — it's live for 48 hours then it's gone",
-                    "your audience shows up because urgency creates action",
-                    "no permanent link means no takedown",
-                ],
-            },
-            "product_aware": {
-                "hook": "this app lets you share mixes that self-destruct",
-                "goal": "demo: upload → timer → share → reactions → poof",
-                "cta": "drop your first mix free",
-                "script": [
-                    "this app lets you share mixes that self-destruct",
-                    "upload any audio set a timer and share the link",
-                    "listeners react in real time with emoji",
-                    "when the timer hits zero — gone",
-                    "drop your first mix right now",
-                ],
-            },
-            "most_aware": {
-                "hook": "DJs are already dropping exclusive sets on here every week",
-                "goal": "social proof + FOMO",
-                "cta": "drop your first mix — it's free",
-                "script": [
-                    "DJs are already dropping exclusive sets on here every week",
-                    "the 48 hour window creates FOMO that drives real engagement",
-                    "your listen-through rate will be higher than any platform",
-                    "drop your first mix free",
-                ],
-            },
-        },
-
-        "fate": {
-            "familiarity": "You've had a mix taken down. Everyone has.",
-            "authority": "Built by a DJ who was tired of losing sets to copyright bots.",
-            "trust": "Show: upload → set timer → share link → real-time reactions → auto-delete",
-            "emotion": "Excitement: 'My audience actually shows up now because they know it won't last.'",
-        },
-    },
-}
+# Each offer is one <key>.json file in offer_specs/ next to this module
+# (name, tagline, icp, jtbd, pains, objections, transformation, mechanism,
+# features, formats, brand_safety, search_keywords, hashtags,
+# awareness_hooks, fate). Specs are parsed on first access only, so
+# importing this module or running one offer never parses the others.
+# Installed packages can also ship offers through the entry point group
+# below; each entry point loads a spec dict (or a callable returning one).
+OFFER_SPECS_DIR = Path(__file__).resolve().parent / "offer_specs"
+OFFER_ENTRY_POINT_GROUP = "creative_radar.offers"
+
+# Schwartz awareness stages, least → most aware. A loaded spec keeps its
+# awareness_hooks as a tuple of AwarenessStage in this order instead of a
+# dict of dicts.
+STAGE_ORDER = ("unaware", "problem_aware", "solution_aware", "product_aware", "most_aware")
+AwarenessStage = namedtuple("AwarenessStage", "stage hook goal cta script", defaults=("", "", "", ()))
+
+# Strings at least this long (script lines, ICP sentences) are rarely
+# repeated across offers, so interning them saves nothing
+_INTERN_MAX_LEN = 64
+
+
+def _intern_tree(obj):
+    """
+    Intern the short strings of a parsed spec and freeze its lists into
+    tuples (scripts, icp, pains, keywords, hashtags...), recursing into
+    containers. Specs are read-only config, so nothing appends to them.
+    """
+    if isinstance(obj, str):
+        return sys.intern(obj) if len(obj) < _INTERN_MAX_LEN else obj
+    if isinstance(obj, dict):
+        return {k: _intern_tree(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return tuple(_intern_tree(v) for v in obj)
+    return obj
+
+
+class _KeywordMatcher:
+    """Finds which (category, keyword) pairs of a vocabulary occur in a text.
+
+    Used for offers' search_keywords and ContentTagger's signal lists.
+    """
+
+    def __init__(self, search_keywords: Mapping, fold_case: bool = True):
+        self.pairs = tuple(
+            (category, kw) for category, kws in search_keywords.items() for kw in kws
+        )
+        self._pair_phrases = tuple(kw.lower() if fold_case else kw for _, kw in self.pairs)
+        self._phrases = frozenset(self._pair_phrases)
+        # Flat per-pair category codes into category_vocab, so per-category
+        # hit counts are one pass over parallel tuples
+        self.category_vocab = tuple(search_keywords)
+        codes = {category: i for i, category in enumerate(self.category_vocab)}
+        self._pair_codes = tuple(codes[category] for category, _ in self.pairs)
+        self._automaton = None
+        if HAS_AHOCORASICK and self._phrases:
+            self._automaton = ahocorasick.Automaton()
+            for phrase in self._phrases:
+                self._automaton.add_word(phrase, phrase)
+            self._automaton.make_automaton()
+
+    def _found(self, text_lower: str) -> frozenset:
+        if self._automaton is not None:
+            return frozenset(phrase for _, phrase in self._automaton.iter(text_lower))
+        return frozenset(p for p in self._phrases if p in text_lower)
+
+    def pair_hits(self, text_lower: str) -> List[bool]:
+        """Whether each (category, keyword) pair occurs in text_lower, indexed like pairs."""
+        found = self._found(text_lower)
+        return [phrase in found for phrase in self._pair_phrases]
+
+    def category_hits(self, text_lower: str) -> List[int]:
+        """Matched keyword count per category, indexed like category_vocab."""
+        found = self._found(text_lower)
+        hits = [0] * len(self.category_vocab)
+        for code, phrase in zip(self._pair_codes, self._pair_phrases):
+            if phrase in found:
+                hits[code] += 1
+        return hits
+
+
+@lru_cache(maxsize=1)
+def _offer_entry_points() -> dict:
+    """offer_key → entry point for offers registered by installed packages."""
+    from importlib.metadata import entry_points
+    return {ep.name: ep for ep in entry_points(group=OFFER_ENTRY_POINT_GROUP)}
+
+
+@lru_cache(maxsize=1)
+def _available_keys() -> Tuple[str, ...]:
+    """Offer keys: offer_specs/*.json stems, then entry-point offers."""
+    keys = [p.stem for p in sorted(OFFER_SPECS_DIR.glob("*.json"))]
+    keys += [name for name in sorted(_offer_entry_points()) if name not in keys]
+    return tuple(keys)
+
+
+def _read_spec(offer_key: str) -> dict:
+    """Raw spec for offer_key, from offer_specs/ or else an entry point."""
+    path = OFFER_SPECS_DIR / f"{offer_key}.json"
+    if path.exists():
+        return _json_loads(path.read_bytes())
+    spec = _offer_entry_points()[offer_key].load()
+    return spec() if callable(spec) else spec
+
+
+def _known_keys(offer_key: str, section: str, data: dict, known) -> dict:
+    """data limited to the known keys, warning about (and dropping) the rest."""
+    unknown = [k for k in data if k not in known]
+    if unknown:
+        logger.warning(f"Offer spec '{offer_key}': ignoring unknown {section} keys {unknown}")
+    return {k: v for k, v in data.items() if k in known}
+
+
+def _load_spec(offer_key: str) -> dict:
+    """Load one offer spec into its frozen, interned form."""
+    spec = _intern_tree(_read_spec(offer_key))
+    if "hashtags" in spec:
+        spec["hashtags"] = tuple(dict.fromkeys(spec["hashtags"]))
+    hooks = spec.get("awareness_hooks") or {}
+    spec["awareness_hooks"] = tuple(
+        AwarenessStage(stage, **_known_keys(
+            offer_key, f"awareness_hooks.{stage}", hooks[stage], AwarenessStage._fields[1:]
+        ))
+        for stage in STAGE_ORDER if stage in hooks
+    )
+    return spec
+
+
+@dataclass(frozen=True, slots=True)
+class FateFrame:
+    """FATE framework beats for an offer's creative."""
+    familiarity: str = ""
+    authority: str = ""
+    trust: str = ""
+    emotion: str = ""
+
+    def items(self) -> List[Tuple[str, str]]:
+        """(beat, text) pairs for the beats the offer fills in."""
+        return [(f.name, getattr(self, f.name)) for f in fields(self) if getattr(self, f.name)]
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CompiledSpec(Mapping):
+    """
+    A loaded offer spec as fixed, slotted fields plus the lookup
+    structures derived from it (keyword matcher, lowercased formats,
+    fit-score terms).
+
+    It is also a read-only Mapping over the spec fields, so existing
+    spec["name"] / spec.get("pains", []) call sites in the tagger and
+    ranker keep working.
+    """
+    offer_key: str
+    name: str = ""
+    tagline: str = ""
+    url: str = ""
+    cta: str = ""
+    icp: tuple = ()
+    jtbd: tuple = ()
+    pains: tuple = ()
+    objections: tuple = ()
+    transformation: tuple = ()
+    mechanism: str = ""
+    mechanism_short: str = ""
+    features: tuple = ()
+    formats_preferred: tuple = ()
+    formats_avoid: tuple = ()
+    brand_safety: tuple = ()
+    search_keywords: Mapping = field(default_factory=dict)
+    hashtags: tuple = ()
+    awareness_hooks: tuple = ()  # AwarenessStage entries in STAGE_ORDER
+    fate: FateFrame = field(default_factory=FateFrame)
+    # Keys in the JSON that have no field above
+    extra: Mapping = field(default_factory=dict)
+    # Derived lookups - not part of the Mapping view
+    keyword_matcher: Optional[_KeywordMatcher] = None
+    formats_preferred_lower: frozenset = frozenset()
+    pain_terms: tuple = ()            # _significant_words() per pain
+    jtbd_terms: tuple = ()            # ... per jtbd
+    transformation_terms: tuple = ()  # ... per transformation
+
+    # One instance per offer (see _build_compiled_spec), so identity is
+    # enough - and lets a spec be a dict / lru_cache key
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+    def __getitem__(self, key: str):
+        if key in _SPEC_FIELDS:
+            return getattr(self, key)
+        return self.extra[key]
+
+    def __iter__(self):
+        yield from _SPEC_FIELDS
+        yield from self.extra
+
+    def __len__(self) -> int:
+        return len(_SPEC_FIELDS) + len(self.extra)
+
+
+# Fields exposed through CompiledSpec's Mapping view
+_DERIVED_FIELDS = frozenset({
+    "keyword_matcher", "formats_preferred_lower",
+    "pain_terms", "jtbd_terms", "transformation_terms",
+})
+_SPEC_FIELDS = tuple(
+    f.name for f in fields(CompiledSpec)
+    if f.name not in ("offer_key", "extra") and f.name not in _DERIVED_FIELDS
+)
+
+
+def _significant_words(phrases) -> Tuple[Tuple[str, ...], ...]:
+    """Lowercased words longer than 3 chars, per phrase - what fit scoring looks for."""
+    return tuple(tuple(w for w in phrase.lower().split() if len(w) > 3) for phrase in phrases)
+
+
+@lru_cache(maxsize=32)
+def _build_compiled_spec(offer_key: str) -> CompiledSpec:
+    """Load and compile one offer spec; built once per offer per process."""
+    spec = _load_spec(offer_key)
+    known = {k: v for k, v in spec.items() if k in _SPEC_FIELDS}
+    known["fate"] = FateFrame(**_known_keys(
+        offer_key, "fate", spec.get("fate", {}), {f.name for f in fields(FateFrame)}
+    ))
+    known["search_keywords"] = MappingProxyType(spec.get("search_keywords", {}))
+    return CompiledSpec(
+        offer_key=offer_key,
+        **known,
+        extra=MappingProxyType({k: v for k, v in spec.items() if k not in _SPEC_FIELDS}),
+        keyword_matcher=_KeywordMatcher(spec.get("search_keywords", {})),
+        formats_preferred_lower=frozenset(f.lower() for f in spec.get("formats_preferred", ())),
+        pain_terms=_significant_words(spec.get("pains", ())),
+        jtbd_terms=_significant_words(spec.get("jtbd", ())),
+        transformation_terms=_significant_words(spec.get("transformation", ())),
+    )
+
+
+def clear_spec_cache():
+    """Forget compiled specs and offer keys, e.g. after editing offer_specs/."""
+    _build_compiled_spec.cache_clear()
+    _available_keys.cache_clear()
+    _offer_entry_points.cache_clear()
+
+
+class _OfferSpecRegistry(Mapping):
+    """Read-only offer_key → spec mapping that loads each spec lazily."""
+
+    def __contains__(self, offer_key) -> bool:
+        # A bundled spec file answers without scanning entry points
+        return (OFFER_SPECS_DIR / f"{offer_key}.json").exists() or offer_key in _available_keys()
+
+    def __getitem__(self, offer_key: str) -> CompiledSpec:
+        if offer_key not in self:
+            raise KeyError(offer_key)
+        return _build_compiled_spec(offer_key)
+
+    def __iter__(self):
+        return iter(_available_keys())
+
+    def __len__(self) -> int:
+        return len(_available_keys())
+
+
+OFFER_SPECS: Mapping[str, Mapping] = _OfferSpecRegistry()
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -695,6 +330,9 @@ OFFER_SPECS: Dict[str, dict] = {
 #    type, pain point, CTA pattern
 # ═══════════════════════════════════════════════════════════════
 
+_EMOJI_RE = re.compile(r"[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF]")
+
+
 class ContentTagger:
     """Tags posts/ads with awareness stage, hook type, pain point, and CTA."""
 
@@ -720,6 +358,21 @@ class ContentTagger:
         "missed_opportunity": ["missed", "opportunity", "pipeline", "follow up", "lead", "prospect"],
     }
 
+    # Awareness stage vocabularies, checked in _detect_awareness_stage's cascade
+    STAGE_WORDS = {
+        "objection": ["cancel", "no pressure", "not spammy", "free trial", "risk-free"],
+        "feature":   ["feature", "how it works", "screen", "demo", "warmth score", "reminder"],
+        "mechanism": ["system", "method", "rhythm", "routine", "framework", "process", "crm", "tracker", "app"],
+        "pain":      ["drift", "ghost", "overwhelm", "forget", "awkward", "guilt", "busy", "losing touch", "no system"],
+        "emotion":   ["feel", "care", "love", "friend", "relationship", "human", "connect", "life"],
+    }
+
+    # One scan per text for every phrase above (Aho-Corasick when available).
+    # Phrases are matched as written against the lowercased text, like the
+    # per-phrase substring checks these replace.
+    _PAIN_MATCHER = _KeywordMatcher(PAIN_SIGNALS, fold_case=False)
+    _STAGE_MATCHER = _KeywordMatcher(STAGE_WORDS, fold_case=False)
+
     # CTA pattern detectors
     CTA_PATTERNS = {
         "download":   re.compile(r"(download|get the app|install|app store|google play)", re.I),
@@ -736,17 +389,18 @@ class ContentTagger:
         """Tag a single post with awareness stage, hook type, pain points, CTA, fit score."""
         text = (post.get("ad_text") or post.get("text_content") or post.get("caption") or "").strip()
         hook_line = text.split("\n")[0].strip() if text else ""
+        text_lower = text.lower()  # shared by the phrase-matching detectors below
 
         tags = {
             "hook_type": self._classify_hook(hook_line),
             "hook_line": hook_line[:120],
-            "awareness_stage": self._detect_awareness_stage(text, offer_spec),
-            "pain_points": self._detect_pains(text),
+            "awareness_stage": self._detect_awareness_stage(text_lower, offer_spec),
+            "pain_points": self._detect_pains(text_lower),
             "cta_type": self._detect_cta(text),
             "content_type": self._detect_content_type(post),
             "word_count": len(text.split()),
-            "has_emoji": bool(re.search(r"[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF]", text)),
-            "fit_score": self._compute_fit_score(text, offer_spec),
+            "has_emoji": bool(_EMOJI_RE.search(text)),
+            "fit_score": self._compute_fit_score(text_lower, offer_spec),
         }
         return tags
 
@@ -758,48 +412,39 @@ class ContentTagger:
                 return hook_type
         return "statement"
 
-    def _detect_awareness_stage(self, text: str, offer_spec: dict) -> str:
-        """Classify which Schwartz stage this content targets."""
-        text_lower = text.lower()
+    def _detect_awareness_stage(self, text_lower: str, offer_spec: dict) -> str:
+        """Classify which Schwartz stage this (lowercased) content targets."""
         product_name = offer_spec.get("name", "").lower()
+        names_product = product_name in text_lower
+        objection, feature, solution_count, pain_count, emotion_count = (
+            self._STAGE_MATCHER.category_hits(text_lower)
+        )
 
         # Stage 5: Most aware — mentions product + objections
-        objection_words = ["cancel", "no pressure", "not spammy", "free trial", "risk-free"]
-        if product_name in text_lower and any(w in text_lower for w in objection_words):
+        if names_product and objection:
             return "most_aware"
 
         # Stage 4: Product aware — mentions product + features/demo
-        feature_words = ["feature", "how it works", "screen", "demo", "warmth score", "reminder"]
-        if product_name in text_lower and any(w in text_lower for w in feature_words):
+        if names_product and feature:
             return "product_aware"
 
         # Stage 3: Solution aware — mentions mechanism/system
-        mechanism_words = ["system", "method", "rhythm", "routine", "framework", "process", "crm", "tracker", "app"]
-        solution_count = sum(1 for w in mechanism_words if w in text_lower)
         if solution_count >= 2:
             return "solution_aware"
 
         # Stage 2: Problem aware — names the pain explicitly
-        pain_words = ["drift", "ghost", "overwhelm", "forget", "awkward", "guilt", "busy", "losing touch", "no system"]
-        pain_count = sum(1 for w in pain_words if w in text_lower)
         if pain_count >= 2:
             return "problem_aware"
 
         # Stage 1: Unaware — emotional/truth content, no product/solution
-        emotion_words = ["feel", "care", "love", "friend", "relationship", "human", "connect", "life"]
-        emotion_count = sum(1 for w in emotion_words if w in text_lower)
         if emotion_count >= 2 and solution_count == 0:
             return "unaware"
 
         return "unclassified"
 
-    def _detect_pains(self, text: str) -> List[str]:
-        text_lower = text.lower()
-        detected = []
-        for pain_name, signals in self.PAIN_SIGNALS.items():
-            if any(s in text_lower for s in signals):
-                detected.append(pain_name)
-        return detected
+    def _detect_pains(self, text_lower: str) -> List[str]:
+        hits = self._PAIN_MATCHER.category_hits(text_lower)
+        return [pain_name for pain_name, hit in zip(self._PAIN_MATCHER.category_vocab, hits) if hit]
 
     def _detect_cta(self, text: str) -> str:
         for cta_type, pattern in self.CTA_PATTERNS.items():
@@ -814,40 +459,48 @@ class ContentTagger:
             return "image"
         return "text"
 
-    def _compute_fit_score(self, text: str, offer_spec: dict) -> float:
-        """0.0–1.0 score for how well this post matches the offer's ICP/pains/jtbd."""
-        if not text:
+    def _compute_fit_score(self, text_lower: str, offer_spec: dict) -> float:
+        """0.0–1.0 score for how well this (lowercased) post matches the offer's ICP/pains/jtbd."""
+        if not text_lower:
             return 0.0
 
-        text_lower = text.lower()
         score = 0.0
         max_score = 0.0
 
+        # Word lists are precomputed on compiled specs; plain dicts get them per call
+        if isinstance(offer_spec, CompiledSpec):
+            pain_terms = offer_spec.pain_terms
+            jtbd_terms = offer_spec.jtbd_terms
+            transformation_terms = offer_spec.transformation_terms
+        else:
+            pain_terms = _significant_words(offer_spec.get("pains", []))
+            jtbd_terms = _significant_words(offer_spec.get("jtbd", []))
+            transformation_terms = _significant_words(offer_spec.get("transformation", []))
+
         # Pain match
-        for pain in offer_spec.get("pains", []):
+        for pain_words in pain_terms:
             max_score += 1.0
-            pain_words = [w for w in pain.lower().split() if len(w) > 3]
             if any(w in text_lower for w in pain_words):
                 score += 1.0
 
         # JTBD match
-        for jtbd in offer_spec.get("jtbd", []):
+        for jtbd_words in jtbd_terms:
             max_score += 0.5
-            jtbd_words = [w for w in jtbd.lower().split() if len(w) > 3]
             if sum(1 for w in jtbd_words if w in text_lower) >= 2:
                 score += 0.5
 
-        # Keyword match
-        for category, keywords in offer_spec.get("search_keywords", {}).items():
-            for kw in keywords:
-                max_score += 0.3
-                if kw.lower() in text_lower:
-                    score += 0.3
+        # Keyword match - one scan per post via the spec's prebuilt matcher
+        matcher = getattr(offer_spec, "keyword_matcher", None) or _KeywordMatcher(offer_spec.get("search_keywords", {}))
+        # Accumulated per pair, not multiplied, so float rounding (and so
+        # rankings) match the per-keyword loop this replaced
+        for hit in matcher.pair_hits(text_lower):
+            max_score += 0.3
+            if hit:
+                score += 0.3
 
         # Transformation match
-        for t in offer_spec.get("transformation", []):
+        for t_words in transformation_terms:
             max_score += 0.5
-            t_words = [w for w in t.lower().split() if len(w) > 3]
             if sum(1 for w in t_words if w in text_lower) >= 2:
                 score += 0.5
 
@@ -943,7 +596,9 @@ class RankingEngine:
 
     def _format_score(self, post: dict, tags: dict, offer_spec: dict) -> float:
         """Does format match offer's preferred production constraints?"""
-        preferred = [f.lower() for f in offer_spec.get("formats_preferred", [])]
+        preferred = getattr(offer_spec, "formats_preferred_lower", None)
+        if preferred is None:
+            preferred = frozenset(f.lower() for f in offer_spec.get("formats_preferred", []))
         content_type = tags.get("content_type", "text")
 
         score = 0.3  # baseline
@@ -1138,6 +793,15 @@ class RankingEngine:
 class PatternMiner:
     """Extracts reusable hook templates, proof styles, CTA patterns from ranked posts."""
 
+    # Proof style detectors, run on lowercased post text
+    PROOF_PATTERNS = {
+        "screen_recording":    re.compile(r"screen|demo|recording|walkthrough"),
+        "testimonial":         re.compile(r"testimonial|review|said|told me"),
+        "social_proof_number": re.compile(r"\d+[\d,]*\s*(people|users|downloads|installs|clients)"),
+        "before_after":        re.compile(r"before.*after|transformation|result"),
+        "tutorial":            re.compile(r"step \d|how to|tutorial|guide"),
+    }
+
     def mine(self, scored_posts: List[dict], top_n: int = 30) -> dict:
         """Extract creative primitives from top-ranked posts."""
         top = sorted(scored_posts, key=lambda p: p.get("scores", {}).get("total_score", 0), reverse=True)[:top_n]
@@ -1224,16 +888,9 @@ class PatternMiner:
         styles: Counter = Counter()
         for p in posts:
             text = (p.get("ad_text") or p.get("text_content") or "").lower()
-            if re.search(r"screen|demo|recording|walkthrough", text):
-                styles["screen_recording"] += 1
-            if re.search(r"testimonial|review|said|told me", text):
-                styles["testimonial"] += 1
-            if re.search(r"\d+[\d,]*\s*(people|users|downloads|installs|clients)", text):
-                styles["social_proof_number"] += 1
-            if re.search(r"before.*after|transformation|result", text):
-                styles["before_after"] += 1
-            if re.search(r"step \d|how to|tutorial|guide", text):
-                styles["tutorial"] += 1
+            for style, pattern in self.PROOF_PATTERNS.items():
+                if pattern.search(text):
+                    styles[style] += 1
         return dict(styles.most_common(5))
 
 
@@ -1248,7 +905,7 @@ class CreativeRadar:
         if offer_key not in OFFER_SPECS:
             raise ValueError(f"Unknown offer: {offer_key}. Available: {list(OFFER_SPECS.keys())}")
         self.offer_key = offer_key
-        self.spec = OFFER_SPECS[offer_key]
+        self.spec = _build_compiled_spec(offer_key)
         self.tagger = ContentTagger()
         self.ranker = RankingEngine()
         self.miner = PatternMiner()
@@ -1499,13 +1156,14 @@ class CreativeRadar:
                 patterns = self.mine_patterns()
 
         briefs = {}
-        for stage, stage_data in self.spec.get("awareness_hooks", {}).items():
+        for stage_data in self.spec.get("awareness_hooks", ()):
+            stage = stage_data.stage
             brief = {
                 "stage": stage,
-                "goal": stage_data.get("goal", ""),
-                "primary_hook": stage_data.get("hook", ""),
-                "script_beats": stage_data.get("script", []),
-                "cta": stage_data.get("cta", ""),
+                "goal": stage_data.goal,
+                "primary_hook": stage_data.hook,
+                "script_beats": stage_data.script,
+                "cta": stage_data.cta,
                 "competitor_hooks": [],
                 "recommended_format": "",
                 "generated_at": datetime.now().isoformat(),
@@ -1641,10 +1299,10 @@ class CreativeRadar:
                         print(f"    {D}→ {ch[:90]}{R}")
 
         # FATE check
-        fate = self.spec.get("fate", {})
+        fate = self.spec.fate.items()
         if fate:
             print(f"\n{Y}{B}── FATE Framework ──{R}")
-            for key, val in fate.items():
+            for key, val in fate:
                 print(f"  {B}{key.upper():<13}{R} {val}")
 
         print(f"\n{hr}")
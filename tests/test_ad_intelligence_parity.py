@@ -0,0 +1,77 @@
+"""
+test_ad_intelligence_parity.py
+==============================
+Parity tests for ad_intelligence's PatternAnalyzer.
+
+tests/fixtures/market_research/ad_intelligence_posts.json holds synthetic
+posts, and ad_intelligence_expected.json the patterns the original
+(pre-optimization) PatternAnalyzer produced for growing prefixes of them.
+
+Run: python3 -m pytest tests/test_ad_intelligence_parity.py
+"""
+
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Appended, not prepended: python/selectors would shadow the stdlib module
+sys.path.append(str(Path(__file__).resolve().parent.parent / "python"))
+
+from market_research import ad_intelligence  # noqa: E402
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "market_research"
+
+
+def _fixture(name: str):
+    with open(FIXTURES / name, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _plain(obj):
+    """Normalize tuples / Counters the way the fixtures were written."""
+    return json.loads(json.dumps(obj, default=str))
+
+
+AD_POSTS = _fixture("ad_intelligence_posts.json")
+AD_EXPECTED = _fixture("ad_intelligence_expected.json")
+
+
+class TestPatternAnalyzerParity:
+
+    @pytest.mark.parametrize("n", sorted(AD_EXPECTED, key=int))
+    def test_analyze_matches_baseline(self, n):
+        patterns = ad_intelligence.PatternAnalyzer().analyze(AD_POSTS[:int(n)], "kw")
+        patterns.pop("analyzed_at", None)
+        assert _plain(patterns) == AD_EXPECTED[n]
+
+
+class TestAnalyzeCached:
+
+    def test_cached_analysis_is_fresh_per_call(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(ad_intelligence, "PATTERNS_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(ad_intelligence, "_shared_storage", lambda: None)
+        gen = ad_intelligence.AdBriefGenerator(write_md=False)
+        gen._analyze_cached(AD_POSTS, "kw", "facebook")
+
+        # Backdate the cached entry; hits must not report its timestamp
+        (cache_file,) = tmp_path.glob("*.json")
+        stale = datetime(2000, 1, 1).isoformat()
+        cached = json.loads(cache_file.read_text())
+        cached["analyzed_at"] = stale
+        cache_file.write_text(json.dumps(cached))
+
+        hit = gen._analyze_cached(AD_POSTS, "kw", "facebook")
+        assert hit["analyzed_at"] != stale
+        hit["top_hooks"].append("mutated")
+        assert "mutated" not in gen._analyze_cached(AD_POSTS, "kw", "facebook")["top_hooks"]
+
+        hit["top_hooks"].pop()
+        hit.pop("analyzed_at")
+        fresh = ad_intelligence.PatternAnalyzer().analyze(
+            AD_POSTS[:ad_intelligence.PatternAnalyzer.ANALYZE_WINDOW], "kw"
+        )
+        fresh.pop("analyzed_at")
+        assert _plain(hit) == _plain(fresh)
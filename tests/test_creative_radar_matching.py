@@ -0,0 +1,159 @@
+"""
+test_creative_radar_matching.py
+===============================
+Unit tests for creative_radar's lookup structures: _KeywordMatcher with
+and without pyahocorasick, the CompiledSpec Mapping view, and the
+precompiled proof-style patterns.
+
+Run: python3 -m pytest tests/test_creative_radar_matching.py
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Appended, not prepended: python/selectors would shadow the stdlib module
+sys.path.append(str(Path(__file__).resolve().parent.parent / "python"))
+
+from market_research import creative_radar  # noqa: E402
+from market_research.creative_radar import CompiledSpec, PatternMiner, _KeywordMatcher  # noqa: E402
+
+VOCAB = {
+    "drift": ["drift", "lost touch", "growing apart"],
+    "crm": ["Personal CRM", "follow up"],
+    "empty": [],
+    "overlap": ["drift", "ADHD"],
+}
+
+
+@pytest.fixture(params=["substring", "ahocorasick"])
+def backend(request, monkeypatch):
+    """Build matchers with each backend - the automaton only if installed."""
+    if request.param == "ahocorasick":
+        module = pytest.importorskip("ahocorasick")
+        monkeypatch.setattr(creative_radar, "ahocorasick", module, raising=False)
+        monkeypatch.setattr(creative_radar, "HAS_AHOCORASICK", True)
+    else:
+        monkeypatch.setattr(creative_radar, "HAS_AHOCORASICK", False)
+    return request.param
+
+
+def _hit_pairs(matcher, text_lower):
+    return [pair for pair, hit in zip(matcher.pairs, matcher.pair_hits(text_lower)) if hit]
+
+
+class TestKeywordMatcher:
+
+    def test_uses_selected_backend(self, backend):
+        matcher = _KeywordMatcher(VOCAB)
+        assert (matcher._automaton is not None) == (backend == "ahocorasick")
+
+    def test_pair_hits_align_with_pairs_in_vocabulary_order(self, backend):
+        matcher = _KeywordMatcher(VOCAB)
+        hits = matcher.pair_hits("we started drifting, need a personal crm to follow up")
+        assert len(hits) == len(matcher.pairs)
+        assert _hit_pairs(matcher, "we started drifting, need a personal crm to follow up") == [
+            ("drift", "drift"),
+            ("crm", "Personal CRM"),
+            ("crm", "follow up"),
+            ("overlap", "drift"),
+        ]
+
+    def test_category_hits_count_distinct_phrases(self, backend):
+        matcher = _KeywordMatcher(VOCAB)
+        hits = matcher.category_hits("drift drift lost touch follow up")
+        assert matcher.category_vocab == ("drift", "crm", "empty", "overlap")
+        assert hits == [2, 1, 0, 1]
+
+    def test_fold_case_false_matches_phrases_as_written(self, backend):
+        text = "my adhd brain"
+        assert _KeywordMatcher(VOCAB).category_hits(text)[3] == 1
+        # ContentTagger's signal lists keep the original case-sensitive checks
+        assert _KeywordMatcher(VOCAB, fold_case=False).category_hits(text)[3] == 0
+
+    def test_empty_vocabulary(self, backend):
+        matcher = _KeywordMatcher({})
+        assert matcher.pairs == ()
+        assert matcher.pair_hits("anything") == []
+        assert matcher.category_hits("anything") == []
+
+    def test_agrees_with_substring_checks(self, backend):
+        rng = random.Random(5)
+        words = ["drift", "drifting", "lost", "touch", "personal", "crm", "follow", "up", "ADHD", "adhd"]
+        matcher = _KeywordMatcher(VOCAB)
+        for _ in range(500):
+            text = " ".join(rng.choice(words) for _ in range(rng.randint(0, 12))).lower()
+            expected = [(c, kw) for c, kw in matcher.pairs if kw.lower() in text]
+            assert _hit_pairs(matcher, text) == expected
+
+
+class TestCompiledSpec:
+
+    @pytest.fixture
+    def spec(self):
+        return creative_radar.OFFER_SPECS["everreach"]
+
+    def test_registry_returns_one_instance_per_offer(self, spec):
+        assert isinstance(spec, CompiledSpec)
+        assert creative_radar.OFFER_SPECS["everreach"] is spec
+        assert {spec: 1}[spec] == 1
+
+    def test_unknown_offer_raises_key_error(self):
+        assert "no-such-offer" not in creative_radar.OFFER_SPECS
+        with pytest.raises(KeyError):
+            creative_radar.OFFER_SPECS["no-such-offer"]
+
+    def test_mapping_view_hides_derived_fields(self, spec):
+        keys = list(spec)
+        assert "name" in keys and "search_keywords" in keys
+        for derived in ("offer_key", "extra", "keyword_matcher", "formats_preferred_lower",
+                        "pain_terms", "jtbd_terms", "transformation_terms"):
+            assert derived not in keys
+            assert spec.get(derived) is None
+        assert len(spec) == len(keys)
+        assert spec["name"] == spec.name
+
+    def test_is_read_only(self, spec):
+        with pytest.raises(TypeError):
+            spec["name"] = "other"
+        with pytest.raises(TypeError):
+            spec.search_keywords["new"] = ["x"]
+        with pytest.raises(AttributeError):
+            spec.name = "other"
+
+    def test_fit_terms_match_per_call_split(self, spec):
+        expected = tuple(
+            tuple(w for w in pain.lower().split() if len(w) > 3) for pain in spec["pains"]
+        )
+        assert spec.pain_terms == expected
+
+    def test_unknown_hook_and_fate_keys_are_dropped(self, monkeypatch):
+        raw = dict(creative_radar._read_spec("everreach"))
+        raw["awareness_hooks"] = dict(raw["awareness_hooks"])
+        raw["awareness_hooks"]["unaware"] = dict(raw["awareness_hooks"]["unaware"], notes="x")
+        raw["fate"] = dict(raw.get("fate", {}), extra_beat="y")
+        monkeypatch.setattr(creative_radar, "_read_spec", lambda offer_key: raw)
+        creative_radar.clear_spec_cache()
+        try:
+            spec = creative_radar.OFFER_SPECS["everreach"]
+            assert spec.awareness_hooks[0].stage == "unaware"
+            assert [beat for beat, _ in spec.fate.items()] == ["familiarity", "authority", "trust", "emotion"]
+        finally:
+            creative_radar.clear_spec_cache()
+
+
+class TestProofStyles:
+
+    def test_counts_each_style_once_per_post(self):
+        posts = [{"text_content": "demo demo screen, review review"}, {"ad_text": "Step 1: DEMO"}]
+        assert PatternMiner()._extract_proof_styles(posts) == {
+            "screen_recording": 2, "testimonial": 1, "tutorial": 1,
+        }
+
+    def test_long_match_does_not_hide_other_styles(self):
+        posts = [{"text_content": "before i read the review and the tutorial, after all"}]
+        assert PatternMiner()._extract_proof_styles(posts) == {
+            "testimonial": 1, "before_after": 1, "tutorial": 1,
+        }
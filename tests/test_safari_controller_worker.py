@@ -0,0 +1,140 @@
+"""
+test_safari_controller_worker.py
+================================
+Tests for SafariController's resident JavaScript worker protocol.
+
+osascript is swapped for small Python processes that speak (or break)
+the worker's one-JSON-line-per-script protocol, so these run anywhere.
+
+Run: python3 -m pytest tests/test_safari_controller_worker.py
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Appended, not prepended: python/selectors would shadow the stdlib module
+sys.path.append(str(Path(__file__).resolve().parent.parent / "python"))
+
+from controllers import safari_controller  # noqa: E402
+from controllers.safari_controller import SafariController  # noqa: E402
+
+_REAL_POPEN = subprocess.Popen
+
+# Answers every script with {"ok": true, "out": "ran:<script>"}
+ECHO_WORKER = '''
+import json, sys
+for line in sys.stdin:
+    sys.stdout.write(json.dumps({"ok": True, "out": "ran:" + json.loads(line)}) + "\\n")
+    sys.stdout.flush()
+'''
+# Takes one script, then exits without answering
+DIES_AFTER_READ_WORKER = '''
+import sys
+sys.stdin.readline()
+'''
+# Answers with a line that isn't protocol JSON
+GARBAGE_WORKER = '''
+import sys
+sys.stdin.readline()
+sys.stdout.write("not json\\n")
+sys.stdout.flush()
+sys.stdin.readline()
+'''
+# Takes one script and never answers
+HANGING_WORKER = '''
+import sys, time
+sys.stdin.readline()
+time.sleep(60)
+'''
+
+
+@pytest.fixture
+def controller(monkeypatch):
+    """SafariController whose one-shot osascript fallback is recorded, not run."""
+    safari = SafariController()
+    safari.fallback_calls = []
+
+    def run_applescript(script, timeout=30, args=()):
+        safari.fallback_calls.append(args)
+        return True, "fallback:" + args[0]
+
+    monkeypatch.setattr(safari, "run_applescript", run_applescript)
+    yield safari
+    safari.close()
+
+
+def use_worker(monkeypatch, source: str, exit_first: bool = False):
+    """
+    Spawn `source` with Python wherever the controller spawns osascript;
+    with exit_first, wait for it to exit before handing it over.
+    """
+    spawned = []
+
+    def popen(args, **kwargs):
+        proc = _REAL_POPEN([sys.executable, "-c", source], **kwargs)
+        if exit_first:
+            proc.wait()
+        spawned.append(proc)
+        return proc
+
+    monkeypatch.setattr(safari_controller.subprocess, "Popen", popen)
+    return spawned
+
+
+class TestJsWorker:
+
+    def test_reuses_one_worker_across_calls(self, controller, monkeypatch):
+        spawned = use_worker(monkeypatch, ECHO_WORKER)
+        assert controller.execute_js("1 + 1") == "ran:1 + 1"
+        assert controller.execute_js("document.title") == "ran:document.title"
+        assert len(spawned) == 1
+        assert controller.fallback_calls == []
+
+    def test_falls_back_when_worker_cannot_start(self, controller, monkeypatch):
+        def popen(*args, **kwargs):
+            raise OSError("osascript not found")
+
+        monkeypatch.setattr(safari_controller.subprocess, "Popen", popen)
+        assert controller.execute_js("1") == "fallback:1"
+        assert controller.execute_js("2") == "fallback:2"
+        assert controller.fallback_calls == [("1",), ("2",)]
+
+    def test_falls_back_when_worker_dies_before_taking_script(self, controller, monkeypatch):
+        # Exited before the write, so its stdin pipe has no reader
+        use_worker(monkeypatch, "", exit_first=True)
+        assert controller.execute_js("click()") == "fallback:click()"
+        assert controller.fallback_calls == [("click()",)]
+
+    def test_no_rerun_when_worker_dies_after_taking_script(self, controller, monkeypatch):
+        use_worker(monkeypatch, DIES_AFTER_READ_WORKER)
+        assert controller.execute_js("click()") is None
+        # The script may already have run - it must not run a second time
+        assert controller.fallback_calls == []
+        # Later calls stay on one-shot osascript
+        assert controller.execute_js("2") == "fallback:2"
+
+    def test_bad_reply_fails_call_and_restarts_worker(self, controller, monkeypatch):
+        spawned = use_worker(monkeypatch, GARBAGE_WORKER)
+        assert controller._run_js_in_worker("1", timeout=5) == (False, "bad worker reply")
+        assert controller.fallback_calls == []
+        assert spawned[0].poll() is not None
+
+        use_worker(monkeypatch, ECHO_WORKER)
+        assert controller.execute_js("2") == "ran:2"
+
+    def test_timeout_fails_call_and_restarts_worker(self, controller, monkeypatch):
+        spawned = use_worker(monkeypatch, HANGING_WORKER)
+        assert controller._run_js_in_worker("1", timeout=0.2) == (False, "timeout")
+        assert spawned[0].poll() is not None
+        assert controller.fallback_calls == []
+
+    def test_close_and_context_manager_stop_worker(self, monkeypatch):
+        spawned = use_worker(monkeypatch, ECHO_WORKER)
+        with SafariController() as safari:
+            assert safari.execute_js("1") == "ran:1"
+            assert spawned[0].poll() is None
+        assert spawned[0].poll() is not None
+        safari.close()  # idempotent